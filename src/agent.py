@@ -32,7 +32,7 @@ except ImportError:  # pragma: no cover - fallback when executed directly
     from tools.duckdb_schema_tool import DuckDBSchemaTool
 
 DEFAULT_AZURE_ENDPOINT = "https://slagousis-eastus-resource.cognitiveservices.azure.com/"
-BOOL_TRUE = {"1", "true", "yes", "on"}
+BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
 
 __all__ = [
     "DuckDBChartTool",
@@ -77,6 +77,17 @@ class DuckDBRuntime:
     def schema_manager(self) -> SchemaManager:
         return self.query_tool.schema_manager
 
+    def _release_duckdb_connections(self) -> None:
+        """Close cached DuckDB handles so project files can be renamed or replaced on disk."""
+        tools: List[Any] = [self.query_tool]
+        if self._agent is not None:
+            chart_tool = getattr(self._agent, "duckdb_chart_tool", None)
+            tools.append(getattr(self._agent, "duckdb_tool", None))
+            tools.append(getattr(chart_tool, "query_tool", None))
+        for tool in tools:
+            if isinstance(tool, DuckDBQueryTool):
+                tool.close()
+
     async def list_projects(self) -> List[Dict[str, Any]]:
         async with self._query_lock:
             tool = self.query_tool
@@ -375,6 +386,8 @@ class DuckDBRuntime:
                 total_size_bytes = None
                 total_size_pretty = None
                 try:
+                    # Checkpoint pending WAL writes into the file first so its size is current
+                    self._release_duckdb_connections()
                     db_path = Path(resolved)
                     if db_path.exists():
                         total_size_bytes = db_path.stat().st_size
@@ -454,11 +467,14 @@ class DuckDBRuntime:
                 raise ValueError("No DuckDB database available to reclaim space.")
 
             db_path = Path(resolved)
+            # File sizes only reflect writes once the WAL is checkpointed, which closing the handles does
+            self._release_duckdb_connections()
             old_size = db_path.stat().st_size if db_path.exists() else 0
 
             # Execute VACUUM
             await asyncio.to_thread(self.query_tool.execute_structured, "VACUUM")
 
+            self._release_duckdb_connections()
             new_size = db_path.stat().st_size if db_path.exists() else 0
             freed_bytes = max(0, old_size - new_size)
             freed_pretty = self._format_size(freed_bytes)
@@ -1458,6 +1474,7 @@ class DuckDBRuntime:
                 # Rename .duckdb file
                 if new_target != target:
                     try:
+                        self._release_duckdb_connections()
                         target.rename(new_target)
 
                         # Rename .schema.json file
@@ -1582,39 +1599,44 @@ class DuckDBRuntime:
         search_roots = self.query_tool.search_roots or [Path.cwd()]
         local_dir = search_roots[0]
 
-        # If rename_existing is True and files exist, rename them with version
-        if rename_existing and not overwrite:
-            duckdb_file = local_dir / f"{project_name}.duckdb"
-            schema_file = local_dir / f"{project_name}.schema.json"
-
-            if duckdb_file.exists() or schema_file.exists():
-                # Get current version from schema
-                current_version = "unknown"
-                if schema_file.exists():
-                    try:
-                        schema_data = json.loads(schema_file.read_text(encoding="utf-8"))
-                        current_version = schema_data.get("version", "unknown")
-                    except (json.JSONDecodeError, OSError):
-                        pass
-
-                # Rename existing files
-                if duckdb_file.exists():
-                    new_name = f"{project_name}_v{current_version}.duckdb"
-                    duckdb_file.rename(local_dir / new_name)
-
-                if schema_file.exists():
-                    new_name = f"{project_name}_v{current_version}.schema.json"
-                    schema_file.rename(local_dir / new_name)
-
-        # Download the project
-        duckdb_path, schema_path = await asyncio.to_thread(
-            self.datalake_manager.download_project,
-            datalake_name,
-            project_name,
-            version,
-            local_dir,
-            overwrite=overwrite,
-        )
+        # Hold the query lock so no query reopens the local files while they are renamed or replaced
+        async with self._query_lock:
+            # Local project files may be renamed or overwritten below
+            self._release_duckdb_connections()
+
+            # If rename_existing is True and files exist, rename them with version
+            if rename_existing and not overwrite:
+                duckdb_file = local_dir / f"{project_name}.duckdb"
+                schema_file = local_dir / f"{project_name}.schema.json"
+
+                if duckdb_file.exists() or schema_file.exists():
+                    # Get current version from schema
+                    current_version = "unknown"
+                    if schema_file.exists():
+                        try:
+                            schema_data = json.loads(schema_file.read_text(encoding="utf-8"))
+                            current_version = schema_data.get("version", "unknown")
+                        except (json.JSONDecodeError, OSError):
+                            pass
+
+                    # Rename existing files
+                    if duckdb_file.exists():
+                        new_name = f"{project_name}_v{current_version}.duckdb"
+                        duckdb_file.rename(local_dir / new_name)
+
+                    if schema_file.exists():
+                        new_name = f"{project_name}_v{current_version}.schema.json"
+                        schema_file.rename(local_dir / new_name)
+
+            # Download the project
+            duckdb_path, schema_path = await asyncio.to_thread(
+                self.datalake_manager.download_project,
+                datalake_name,
+                project_name,
+                version,
+                local_dir,
+                overwrite=overwrite,
+            )
 
         return {
             "success": True,
@@ -1664,6 +1686,11 @@ class DuckDBRuntime:
         if match:
             project_name = match.group(1)
 
+        if not schema_only:
+            # Closing the cached handles checkpoints the WAL, so the uploaded .duckdb file has every committed write
+            async with self._query_lock:
+                self._release_duckdb_connections()
+
         # Upload the project
         await asyncio.to_thread(
             self.datalake_manager.upload_project,
@@ -1976,20 +2003,21 @@ class DuckDBRuntime:
 
             # 4. Apply updates
             updated_count = 0
-            for field, description in mapping.items():
-                if field in fields and description:
-                    # We assume these are long descriptions if they are detailed,
-                    # or we could try to split them. For now, let's put it in long_description
-                    # and generate a short one if missing?
-                    # Or just put it in long_description.
-                    # The user asked to "enrich the fields".
-
-                    # Let's put it in long_description as it's safer for "enrichment"
-                    manager.update_field(table, field, long_description=description)
-
-                    # If short description is missing, maybe use the first sentence?
-                    # For now, let's just update long_description.
-                    updated_count += 1
+            with manager.batch():
+                for field, description in mapping.items():
+                    if field in fields and description:
+                        # We assume these are long descriptions if they are detailed,
+                        # or we could try to split them. For now, let's put it in long_description
+                        # and generate a short one if missing?
+                        # Or just put it in long_description.
+                        # The user asked to "enrich the fields".
+
+                        # Let's put it in long_description as it's safer for "enrichment"
+                        manager.update_field(table, field, long_description=description)
+
+                        # If short description is missing, maybe use the first sentence?
+                        # For now, let's just update long_description.
+                        updated_count += 1
 
             return {
                 "success": True,
@@ -2,6 +2,7 @@
 DuckDB Chart Tool - Executes queries and returns data formatted for chart visualization.
 """
 import json
+import traceback
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -90,7 +91,6 @@ class DuckDBChartTool:
                 "plan": plan
             })
         except Exception as e:
-            import traceback
             return json.dumps({
                 "error": f"Failed to generate chart: {str(e)}",
                 "chartType": chart_type,
@@ -140,6 +140,15 @@ class DuckDBChartTool:
             # Convert everything else to string
             return str(val)
 
+        def to_number(val: Any) -> float:
+            """Coerce a value to float, treating NULLs and non-numeric values as 0."""
+            if val is None:
+                return 0.0
+            try:
+                return float(val)
+            except (ValueError, TypeError):
+                return 0.0
+
         # Special case: 3 columns where first two are grouping dimensions
         # (e.g., year, month, count or category, subcategory, value)
         if len(columns) == 3:
@@ -166,14 +175,7 @@ class DuckDBChartTool:
                         labels.append("")
 
                 # Third column is the data - convert to float
-                data_values = []
-                for row in rows:
-                    val = row[2]
-                    try:
-                        num_val = float(val) if val is not None else 0.0
-                        data_values.append(num_val)
-                    except (ValueError, TypeError):
-                        data_values.append(0.0)
+                data_values = [to_number(row[2]) for row in rows]
 
                 datasets = [{
                     "label": str(columns[2]),
@@ -189,43 +191,23 @@ class DuckDBChartTool:
                     "datasets": datasets
                 }
 
-        # Standard case: First column as labels, remaining columns as datasets
-        labels = [str(to_primitive(row[0])) if row[0] is not None else "" for row in rows]
-
-        # Extract datasets from remaining columns
-        datasets = []
-        for col_idx in range(1, len(columns)):
-            data_values = []
-            for row in rows:
-                val = row[col_idx]
-                try:
-                    num_val = float(val) if val is not None else 0.0
-                    data_values.append(num_val)
-                except (ValueError, TypeError):
-                    data_values.append(0.0)
-
-            dataset = {
-                "label": str(columns[col_idx]),
-                "data": data_values
-            }
-            datasets.append(dataset)
-
         # If only one column, treat it as values with row numbers as labels
         if len(columns) == 1:
-            labels = [str(i + 1) for i in range(len(rows))]
-            data_values = []
-            for row in rows:
-                val = row[0]
-                try:
-                    num_val = float(val) if val is not None else 0.0
-                    data_values.append(num_val)
-                except (ValueError, TypeError):
-                    data_values.append(0.0)
-
+            labels = [str(i) for i in range(1, len(rows) + 1)]
             datasets = [{
                 "label": str(columns[0]),
-                "data": data_values
+                "data": [to_number(row[0]) for row in rows]
             }]
+        else:
+            # Standard case: First column as labels, remaining columns as datasets
+            labels = [str(to_primitive(row[0])) if row[0] is not None else "" for row in rows]
+            datasets = [
+                {
+                    "label": str(columns[col_idx]),
+                    "data": [to_number(row[col_idx]) for row in rows]
+                }
+                for col_idx in range(1, len(columns))
+            ]
 
         return {
             "chartType": str(chart_type),
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import json
+import os
 import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from decimal import Decimal
-from io import StringIO
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Iterable, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 import duckdb
 from smolagents import Tool
 
+try:  # Optional: enables columnar (Arrow) result fetching in execute_structured.
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - exercised when dependency is missing
+    pa = None  # type: ignore
+
 from .duckdb_schema_manager import SchemaManager
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -18,6 +31,205 @@ DEFAULT_DATABASES_ROOT = PROJECT_ROOT / "databases"
 
 __all__ = ["DuckDBQueryTool", "DEFAULT_DATABASES_ROOT", "StructuredQueryResult"]
 
+# Extracts the column name from a DB-API ``cursor.description`` entry.
+_COLUMN_NAME = itemgetter(0)
+
+# Skips any (optionally quoted) catalog/schema qualifiers and captures the bare table name.
+_TABLE_REFERENCE_PATTERN = re.compile(
+    r"\b(?:from|join)\s+(?:[`\"\[]?\w+[`\"\]]?\.)*[`\"\[]?([A-Za-z_][\w$]*)",
+    flags=re.IGNORECASE,
+)
+# Private in-memory connection for parse-only work; user SQL is never bound or run on it.
+_PARSER_CONNECTION = duckdb.connect(":memory:")
+_PARSER_LOCK = threading.Lock()
+_READ_STATEMENT_TYPES = frozenset({"SELECT", "EXPLAIN"})
+# Seconds a cached connection may sit unused before it is closed, releasing the file lock for other processes.
+_CONNECTION_IDLE_SECONDS = 5.0
+_SLUG_PATTERN = re.compile(r"[^A-Za-z0-9_-]+")
+# ``PRAGMA table_info`` with the table name bound as a parameter; DuckDB parses quoted and qualified names itself.
+_TABLE_SCHEMA_QUERY = "SELECT * FROM pragma_table_info(?)"
+# Persistent user tables (and views) straight from DuckDB's catalog functions.
+_LIST_TABLES_SQL = """
+    SELECT schema_name, table_name
+    FROM duckdb_tables()
+    WHERE NOT internal AND NOT temporary
+      AND schema_name NOT IN ('information_schema', 'pg_catalog')
+    ORDER BY lower(schema_name), lower(table_name), table_name
+"""
+_LIST_TABLES_AND_VIEWS_SQL = """
+    SELECT schema_name, table_name
+    FROM (
+        SELECT schema_name, table_name
+        FROM duckdb_tables()
+        WHERE NOT internal AND NOT temporary
+        UNION ALL
+        SELECT schema_name, view_name
+        FROM duckdb_views()
+        WHERE NOT internal
+    )
+    WHERE schema_name NOT IN ('information_schema', 'pg_catalog')
+    ORDER BY lower(schema_name), lower(table_name), table_name
+"""
+# Statements that can be wrapped in ``COPY (...) TO`` or a relation ``LIMIT``.
+_READ_QUERY_PATTERN = re.compile(r"(?:select|with|from|values|table|pivot|unpivot)\b", flags=re.IGNORECASE)
+
+
+def _stringify_float(value: float) -> str:
+    # If the number is very big (millions), no decimals
+    if abs(value) >= 1_000_000:
+        return f"{value:,.0f}"
+    # If it's effectively an integer, show as integer
+    if value.is_integer():
+        return f"{int(value)}"
+    # Otherwise limit to 2 decimals
+    return f"{value:.2f}"
+
+
+def _stringify_decimal(value: Decimal) -> str:
+    val_float = float(value)
+    if abs(val_float) >= 1_000_000:
+        return f"{val_float:,.0f}"
+    if value % 1 == 0:
+        return f"{int(value)}"
+    return f"{val_float:.2f}"
+
+
+@lru_cache(maxsize=512)
+def _extract_tables(sql: str) -> tuple[str, ...]:
+    """Return the distinct table names referenced by ``sql`` in order of appearance, memoised per SQL text.
+
+    The SQL is only parsed (``json_serialize_sql`` on the private parser connection), never bound, so
+    table functions such as ``read_csv`` touch no files. CTE names are not reported as tables; the
+    FROM/JOIN regex remains as a fallback for SQL the serialiser rejects (non-SELECT statements).
+    """
+    if not sql:
+        return ()
+    try:
+        with _PARSER_LOCK:
+            serialised = _PARSER_CONNECTION.execute("SELECT json_serialize_sql(?)", [sql]).fetchone()[0]
+    except duckdb.Error:
+        return _extract_tables_by_pattern(sql)
+    tree = json.loads(serialised)
+    if tree.get("error"):
+        return _extract_tables_by_pattern(sql)
+
+    references: list[tuple[int, str]] = []
+    cte_names: set[str] = set()
+    pending: list[Any] = [tree]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            if node.get("type") == "BASE_TABLE" and node.get("table_name"):
+                references.append((node.get("query_location", 0), node["table_name"]))
+            cte_map = node.get("cte_map")
+            if isinstance(cte_map, dict):
+                cte_names.update(str(entry.get("key", "")).lower() for entry in cte_map.get("map", ()))
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+
+    # Keyed by lower-case name so the first spelling wins, in order of appearance.
+    tables: dict[str, str] = {}
+    for _, table_name in sorted(references):
+        lowered = table_name.lower()
+        if lowered not in cte_names:
+            tables.setdefault(lowered, table_name)
+    return tuple(tables.values())
+
+
+def _extract_tables_by_pattern(sql: str) -> tuple[str, ...]:
+    # Keyed by lower-case name so the first spelling wins, in order of appearance.
+    tables: dict[str, str] = {}
+    for match in _TABLE_REFERENCE_PATTERN.finditer(sql):
+        table_name = match.group(1)
+        tables.setdefault(table_name.lower(), table_name)
+    return tuple(tables.values())
+
+
+@lru_cache(maxsize=256)
+def _modifies_database(sql: str) -> bool:
+    """Whether ``sql`` may write to the database; parse-only, so SQL that does not parse counts as a write."""
+    try:
+        with _PARSER_LOCK:
+            statements = _PARSER_CONNECTION.extract_statements(sql)
+    except duckdb.Error:
+        return True
+    return any(statement.type.name not in _READ_STATEMENT_TYPES for statement in statements)
+
+
+def _as_read_query(sql: str) -> Optional[str]:
+    """Return ``sql`` without trailing semicolons if it is a single read-only query, else ``None``."""
+    query = sql.strip().rstrip(";").strip()
+    # ``WITH ... INSERT/UPDATE/DELETE`` passes the keyword check, so ask the parser too
+    if ";" in query or not _READ_QUERY_PATTERN.match(query) or _modifies_database(query):
+        return None
+    return query
+
+
+# Exact-type dispatch for DuckDBQueryTool._stringify (one dict lookup per cell).
+_STRINGIFIERS: dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    bool: str,
+    type(None): lambda _value: "",
+    float: _stringify_float,
+    Decimal: _stringify_decimal,
+}
+
+# DuckDB column types that fetch as str/int/float/bool/None, which ``_jsonify`` returns unchanged.
+_JSON_NATIVE_TYPES = frozenset(
+    {
+        "BOOLEAN",
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "HUGEINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "UHUGEINT",
+        "FLOAT",
+        "DOUBLE",
+        "VARCHAR",
+    }
+)
+
+# DuckDB column types whose Arrow conversion yields the same Python values as ``fetchall()``.
+# Temporal types stay on ``fetchall()``: Arrow turns TIME '24:00:00' into 00:00:00 and raises
+# OverflowError in ``to_pylist()`` for infinite or BC dates and timestamps.
+_ARROW_SAFE_TYPES = frozenset(
+    {
+        "BOOLEAN",
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "FLOAT",
+        "DOUBLE",
+        "VARCHAR",
+        "UUID",
+        "BLOB",
+    }
+)
+
+
+class _LineSink:
+    """Minimal file-like target that collects ``csv.writer`` output line by line."""
+
+    __slots__ = ("lines",)
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, line: str) -> None:
+        self.lines.append(line)
+
 
 @dataclass(slots=True)
 class StructuredQueryResult:
@@ -32,6 +244,16 @@ class StructuredQueryResult:
     message: Optional[str] = None
 
 
+# Every tool instance, held weakly so discarded tools can be garbage collected; closed once at interpreter exit.
+_LIVE_TOOLS: "weakref.WeakSet[DuckDBQueryTool]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_tools() -> None:
+    for tool in list(_LIVE_TOOLS):
+        tool.close()
+
+
 class DuckDBQueryTool(Tool):
     """Tool that locates DuckDB databases and executes SQL queries on demand."""
 
@@ -116,17 +338,29 @@ class DuckDBQueryTool(Tool):
         self,
         search_roots: Iterable[Path] | None = None,
         default_database: Optional[Path] = None,
+        max_display_rows: Optional[int] = 1000,
     ) -> None:
         super().__init__()
         roots = list(search_roots) if search_roots else [DEFAULT_DATABASES_ROOT]
         self.search_roots = [root.expanduser().resolve() for root in roots]
         self.default_database = default_database.expanduser().resolve() if default_database else None
         self.current_database: Optional[Path] = None
+        # Row cap for the 'text' and 'table' formats; ``None`` renders every row.
+        self.max_display_rows = max_display_rows
         if self.default_database and self.default_database.exists():
             self.current_database = self.default_database
-        self.schema_manager = SchemaManager()
-        if self.current_database:
-            self.schema_manager.set_database(self.current_database)
+        self._discovered: List[Path] = []
+        self._project_index: dict[str, Path] = {}
+        # Exact file name -> first discovered path, for ``database=`` lookups by bare name
+        self._name_index: dict[str, Path] = {}
+        self._discovery_stamps: Optional[list[tuple[str, Optional[int]]]] = None
+        self._connections: dict[Path, duckdb.DuckDBPyConnection] = {}
+        self._connection_lock = threading.Lock()
+        # Open cursors per database, pending idle-close timers, and databases to close as soon as they go idle
+        self._active_cursors: dict[Path, int] = {}
+        self._idle_timers: dict[Path, threading.Timer] = {}
+        self._release_requested: set[Path] = set()
+        _LIVE_TOOLS.add(self)
 
     def forward(
         self,
@@ -140,8 +374,6 @@ class DuckDBQueryTool(Tool):
         project_description: Optional[str] = None,
         plan: Optional[str] = None,
     ) -> str:
-        available = self._discover_databases()
-
         if create_project:
             if not project or not project.strip():
                 raise ValueError("To create a project, supply the desired project name via the 'project' argument.")
@@ -151,50 +383,78 @@ class DuckDBQueryTool(Tool):
             return f"Created new DuckDB project at {created_path}"
 
         if list_only or not sql.strip():
-            return self._format_discovery(available)
+            return self._format_discovery(self._discover_databases())
 
-        target = self._resolve_database(database, project, available)
+        target = self._resolve_database(database, project)
         format_choice = (output_format or "text").strip().lower()
-        if format_choice not in {"text", "table", "csv"}:
+        formatter = self._FORMATTERS.get(format_choice)
+        if formatter is None:
             raise ValueError("output_format must be one of: 'text', 'table', or 'csv'.")
 
         self.current_database = target
         self.schema_manager.set_database(target)
+        export_target = Path(csv_path).expanduser().resolve() if csv_path else None
+        # csv output with csv_path only needs the file; the CSV text is not rendered as well.
+        export_only = export_target is not None and format_choice == "csv"
+        exported = False
+        # The csv format renders every row; the other formats only render the first few.
+        display_limit = None if format_choice == "csv" else self.max_display_rows
+        omitted_note = ""
         try:
-            with duckdb.connect(str(target)) as conn:
-                cursor = conn.execute(sql)
-                description = cursor.description
-                if description:
-                    columns = [column[0] for column in description]
-                    rows = cursor.fetchall()
-                    if format_choice == "table":
-                        formatted = self._format_table(columns, rows)
-                    elif format_choice == "csv":
-                        formatted = self._format_csv(columns, rows)
-                    else:
-                        formatted = self._format_text(columns, rows)
+            with self._connect(target) as conn:
+                if _modifies_database(sql):
+                    # Checkpoint and drop the file lock right after writes so other processes see them
+                    self._request_release(target)
+                copied_rows = self._copy_to_csv(conn, sql, export_target) if export_only else None
+                if copied_rows is not None:
+                    exported = True
+                    description = None
+                    formatted = f"Exported {copied_rows} row(s) as CSV."
                 else:
-                    conn.commit()
-                    formatted = "Statement executed successfully (no result set returned)."
+                    cursor = conn.execute(sql)
+                    description = cursor.description
+                    if description:
+                        columns = list(map(_COLUMN_NAME, description))
+                        if display_limit is None or export_target:
+                            # The export is written from these rows, so the query runs only once
+                            rows = cursor.fetchall()
+                        else:
+                            # One extra row tells us whether anything was left behind
+                            rows = cursor.fetchmany(display_limit + 1)
+                        shown_rows = rows if display_limit is None else rows[:display_limit]
+                        if len(shown_rows) < len(rows):
+                            full_result_hint = (
+                                "The CSV export has the full result."
+                                if export_target
+                                else "Use csv_path to export the full result."
+                            )
+                            omitted_note = (
+                                f"\n... more rows omitted (showing the first {display_limit}). {full_result_hint}"
+                            )
+                        formatted = formatter(columns, shown_rows)
+                        formatted += omitted_note
+                    else:
+                        conn.commit()
+                        formatted = "Statement executed successfully (no result set returned)."
         except duckdb.Error as exc:
             raise ValueError(f"DuckDB execution error: {exc}") from exc
 
         export_note = ""
-        if csv_path:
-            export_target = Path(csv_path).expanduser().resolve()
-            export_target.parent.mkdir(parents=True, exist_ok=True)
-            with export_target.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.writer(handle)
-                if description:
-                    writer.writerow(columns)
-                    writer.writerows(rows)
-                else:
-                    writer.writerow(["message"])
-                    writer.writerow([formatted])
+        if export_target:
+            if not exported:
+                export_target.parent.mkdir(parents=True, exist_ok=True)
+                with export_target.open("w", encoding="utf-8", newline="") as handle:
+                    writer = csv.writer(handle)
+                    if description:
+                        writer.writerow(columns)
+                        writer.writerows(rows)
+                    else:
+                        writer.writerow(["message"])
+                        writer.writerow([formatted])
             export_note = f"\nCSV export saved to {export_target}"
 
         header = f"Database: {target} (project: {target.stem})\n"
-        tables_in_query = self._extract_tables(sql)
+        tables_in_query = _extract_tables(sql)
         schema_info = (
             self.schema_manager.describe_tables(tables_in_query)
             if tables_in_query
@@ -206,35 +466,197 @@ class DuckDBQueryTool(Tool):
         return result_text
 
     # Helper methods -----------------------------------------------------
+    @cached_property
+    def schema_manager(self) -> SchemaManager:
+        """Schema metadata for the active database, loaded on first use so listing-only tools never read it."""
+        manager = SchemaManager()
+        if self.current_database:
+            manager.set_database(self.current_database)
+        return manager
+
+    @contextmanager
+    def _connect(self, target: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Yield a fresh cursor on the cached connection for ``target``, opening it on first use.
+
+        The connection holds DuckDB's file lock, so it is closed (checkpointing the WAL) once no cursor has used it
+        for ``_CONNECTION_IDLE_SECONDS``, or as soon as it goes idle after ``_request_release``.
+        """
+        with self._connection_lock:
+            timer = self._idle_timers.pop(target, None)
+            if timer is not None:
+                timer.cancel()
+            conn = self._connections.get(target)
+            cursor = None
+            if conn is not None:
+                try:
+                    cursor = conn.cursor()
+                except duckdb.ConnectionException:
+                    self._connections.pop(target, None)
+            if cursor is None:
+                conn = duckdb.connect(str(target))
+                self._connections[target] = conn
+                cursor = conn.cursor()
+            self._active_cursors[target] = self._active_cursors.get(target, 0) + 1
+        try:
+            with cursor:
+                yield cursor
+        finally:
+            with self._connection_lock:
+                remaining = self._active_cursors.pop(target) - 1
+                if remaining:
+                    self._active_cursors[target] = remaining
+                elif target in self._release_requested:
+                    self._release_requested.discard(target)
+                    self._close_connection_locked(target)
+                elif target in self._connections:
+                    timer = threading.Timer(_CONNECTION_IDLE_SECONDS, self._close_if_idle, args=(target,))
+                    timer.daemon = True
+                    self._idle_timers[target] = timer
+                    timer.start()
+
+    def _request_release(self, target: Path) -> None:
+        """Close ``target``'s connection when its last cursor finishes, e.g. after a write statement."""
+        with self._connection_lock:
+            self._release_requested.add(target)
+
+    def _close_if_idle(self, target: Path) -> None:
+        with self._connection_lock:
+            # A newer timer replaced this one, or a cursor is in use again
+            if self._idle_timers.get(target) is not threading.current_thread() or self._active_cursors.get(target):
+                return
+            self._idle_timers.pop(target, None)
+            self._close_connection_locked(target)
+
+    def _close_connection_locked(self, target: Path) -> None:
+        conn = self._connections.pop(target, None)
+        if conn is not None:
+            try:
+                conn.close()
+            except duckdb.Error:
+                pass
+
+    def close(self) -> None:
+        """
+        Close cached DuckDB connections so the database files can be moved, replaced or copied.
+
+        A connection whose cursor is still in use is left open and closed as soon as that cursor finishes.
+        """
+        with self._connection_lock:
+            timers = list(self._idle_timers.values())
+            self._idle_timers.clear()
+            connections: list[duckdb.DuckDBPyConnection] = []
+            for target in list(self._connections):
+                if self._active_cursors.get(target):
+                    self._release_requested.add(target)
+                else:
+                    self._release_requested.discard(target)
+                    connections.append(self._connections.pop(target))
+        for timer in timers:
+            timer.cancel()
+        for conn in connections:
+            try:
+                conn.close()
+            except duckdb.Error:
+                pass
+
     def _discover_databases(self) -> List[Path]:
+        if self._discovery_stamps is not None and all(
+            self._mtime_ns(path) == stamp for path, stamp in self._discovery_stamps
+        ):
+            return list(self._discovered)
+
+        if len(self.search_roots) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.search_roots)) as executor:
+                scans = list(executor.map(self._scan_root, self.search_roots))
+        else:
+            scans = [self._scan_root(root) for root in self.search_roots]
+
         discovered: List[Path] = []
         seen: set[Path] = set()
-
-        for root in self.search_roots:
-            if root.is_file() and root.suffix.lower() == ".duckdb":
-                resolved = root.resolve()
+        stamps: list[tuple[str, Optional[int]]] = []
+        for root_databases, root_stamps in scans:
+            stamps.extend(root_stamps)
+            for resolved in root_databases:
                 if resolved not in seen:
                     seen.add(resolved)
                     discovered.append(resolved)
-                continue
 
-            if not root.is_dir():
+        discovered.sort()
+        self._discovered = discovered
+        self._project_index = self._build_project_index(discovered)
+        self._name_index = {}
+        for path in discovered:
+            self._name_index.setdefault(path.name, path)
+        self._discovery_stamps = stamps
+        return list(discovered)
+
+    def _build_project_index(self, available: List[Path]) -> dict[str, Path]:
+        """Map every accepted project identifier (stem, file name, relative path) to its database."""
+        index: dict[str, Path] = {}
+        for path in available:
+            # setdefault keeps the first path in discovery order, matching a linear scan
+            index.setdefault(path.stem.lower(), path)
+            index.setdefault(path.name.lower(), path)
+            for root in self.search_roots:
+                try:
+                    rel = path.relative_to(root)
+                except ValueError:
+                    continue
+                index.setdefault(str(rel.with_suffix("")).replace("\\", "/").lower(), path)
+        return index
+
+    def _scan_root(self, root: Path) -> tuple[List[Path], list[tuple[str, Optional[int]]]]:
+        """Return the DuckDB files under ``root`` plus the directory mtimes observed while scanning."""
+        databases: List[Path] = []
+        # Modification times of the root and every walked directory; a directory's mtime changes
+        # whenever an entry is added, removed or renamed inside it.
+        stamps: list[tuple[str, Optional[int]]] = [(str(root), self._mtime_ns(str(root)))]
+
+        if root.is_file() and root.suffix.lower() == ".duckdb":
+            databases.append(root.resolve())
+            return databases, stamps
+
+        if not root.is_dir():
+            return databases, stamps
+
+        pending = [str(root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Stamp before listing so later changes are never missed.
+                            stamps.append((entry.path, self._mtime_ns(entry.path)))
+                            pending.append(entry.path)
+                        elif os.path.normcase(entry.name).endswith(".duckdb"):
+                            databases.append(Path(os.path.realpath(entry.path)))
+            except OSError:
                 continue
+        return databases, stamps
 
-            for candidate in root.rglob("*.duckdb"):
-                resolved = candidate.resolve()
-                if resolved not in seen:
-                    seen.add(resolved)
-                    discovered.append(resolved)
+    def invalidate_discovery(self) -> None:
+        """Force the next discovery call to rescan the search roots."""
+        self._discovery_stamps = None
 
-        discovered.sort()
-        return discovered
+    @staticmethod
+    def _mtime_ns(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
 
     def discover_databases(self) -> List[Path]:
         """Public helper that returns the discovered DuckDB database files."""
         return self._discover_databases()
 
-    def _resolve_database(self, database: Optional[str], project: Optional[str], available: List[Path]) -> Path:
+    def _resolve_database(
+        self,
+        database: Optional[str],
+        project: Optional[str],
+        available: Optional[List[Path]] = None,
+    ) -> Path:
+        # Discovery is only needed for name lookups; explicit paths and the active database skip it.
         if database:
             candidate = Path(database).expanduser()
             if candidate.exists():
@@ -245,9 +667,13 @@ class DuckDBQueryTool(Tool):
                 if nested.exists():
                     return nested
 
-            matches = [path for path in available if path.name == candidate.name]
-            if matches:
-                return matches[0]
+            if available is None:
+                self._discover_databases()
+                match = self._name_index.get(candidate.name)
+            else:
+                match = next((path for path in available if path.name == candidate.name), None)
+            if match is not None:
+                return match
             raise ValueError(f"Requested database '{database}' was not found among discovered DuckDB files.")
 
         if project:
@@ -255,20 +681,17 @@ class DuckDBQueryTool(Tool):
             if not normalized:
                 raise ValueError("Provided project name is empty. Supply a valid project identifier.")
 
-            for path in available:
-                # Check both stem and relative path for matches
-                if path.stem.lower() == normalized or path.name.lower() == normalized:
-                    return path
-
-                # Also check relative path with subdirectories
-                for root in self.search_roots:
-                    try:
-                        rel = path.relative_to(root)
-                        rel_name = str(rel.with_suffix("")).replace("\\", "/").lower()
-                        if rel_name == normalized:
-                            return path
-                    except ValueError:
-                        continue
+            # Match stem, file name or relative path (with subdirectories)
+            if available is None:
+                available = self._discover_databases()
+                index = self._project_index
+            elif available == self._discovered:
+                index = self._project_index
+            else:
+                index = self._build_project_index(available)
+            match = index.get(normalized)
+            if match is not None:
+                return match
 
             available_projects = ", ".join(path.stem for path in available) or "<none>"
             raise ValueError(
@@ -283,6 +706,8 @@ class DuckDBQueryTool(Tool):
         if self.default_database and self.default_database.exists():
             return self.default_database
 
+        if available is None:
+            available = self._discover_databases()
         if len(available) == 1:
             return available[0]
 
@@ -296,6 +721,24 @@ class DuckDBQueryTool(Tool):
             f"Available options:\n{listing}"
         )
 
+    @staticmethod
+    def _copy_to_csv(conn: duckdb.DuckDBPyConnection, sql: str, export_target: Path) -> Optional[int]:
+        """Export a read-only query straight from DuckDB with ``COPY ... TO``.
+
+        Returns the number of rows written, or ``None`` if the statement cannot be exported this way.
+        A failing ``COPY`` raises ``ValueError`` rather than being reported as unexportable.
+        """
+        query = _as_read_query(sql)
+        if query is None:
+            return None
+        export_target.parent.mkdir(parents=True, exist_ok=True)
+        quoted_target = "'" + str(export_target).replace("'", "''") + "'"
+        try:
+            copied = conn.execute(f"COPY ({query}) TO {quoted_target} (FORMAT CSV, HEADER)").fetchone()
+        except duckdb.Error as exc:
+            raise ValueError(f"CSV export to {export_target} failed: {exc}") from exc
+        return int(copied[0]) if copied else 0
+
     @staticmethod
     def _format_discovery(available: List[Path]) -> str:
         if not available:
@@ -309,20 +752,23 @@ class DuckDBQueryTool(Tool):
         if not rows:
             return "Query executed successfully but returned no rows."
 
-        str_rows = [[DuckDBQueryTool._stringify(value) for value in row] for row in rows]
+        stringify = DuckDBQueryTool._stringify
         col_widths = [len(col) for col in columns]
-
-        for row in str_rows:
-            for idx, value in enumerate(row):
-                col_widths[idx] = max(col_widths[idx], len(value))
+        str_rows: list[list[str]] = []
+        for row in rows:
+            # Plain strings are by far the most common cell; skip the call for them
+            str_row = [value if type(value) is str else stringify(value) for value in row]
+            for idx, value in enumerate(str_row):
+                width = len(value)
+                if width > col_widths[idx]:
+                    col_widths[idx] = width
+            str_rows.append(str_row)
 
         # Use Markdown-compatible pipe format with outer pipes
-        header = "| " + " | ".join(col.ljust(col_widths[idx]) for idx, col in enumerate(columns)) + " |"
-        separator = "| " + " | ".join("-" * col_widths[idx] for idx in range(len(columns))) + " |"
-        data_lines = [
-            "| " + " | ".join(value.ljust(col_widths[idx]) for idx, value in enumerate(row)) + " |"
-            for row in str_rows
-        ]
+        line_format = "| " + " | ".join(f"{{:<{width}}}" for width in col_widths) + " |"
+        header = line_format.format(*columns)
+        separator = "| " + " | ".join("-" * width for width in col_widths) + " |"
+        data_lines = [line_format.format(*row) for row in str_rows]
 
         table = "\n".join([header, separator, *data_lines])
         return f"\n{table}"
@@ -336,43 +782,47 @@ class DuckDBQueryTool(Tool):
         header = "| " + " | ".join(columns) + " |"
         separator = "| " + " | ".join("-" * max(3, len(col)) for col in columns) + " |"
 
+        stringify = DuckDBQueryTool._stringify
         lines = [header, separator]
-        for row in rows:
-            lines.append("| " + " | ".join(DuckDBQueryTool._stringify(value) for value in row) + " |")
+        lines.extend(
+            "| " + " | ".join([value if type(value) is str else stringify(value) for value in row]) + " |"
+            for row in rows
+        )
         return "\n".join(lines)
 
     @staticmethod
     def _format_csv(columns: List[str], rows: List[tuple]) -> str:
-        buffer = StringIO()
-        writer = csv.writer(buffer)
+        sink = _LineSink()
+        writer = csv.writer(sink)
         writer.writerow(columns)
         writer.writerows(rows)
-        return buffer.getvalue().strip()
+        lines = sink.lines
+        # Equivalent to stripping the joined text, without a second full-size copy
+        lines[0] = lines[0].lstrip()
+        lines[-1] = lines[-1].rstrip()
+        return "".join(lines)
+
+    # output_format -> formatter; staticmethod objects are callable straight from the class body.
+    _FORMATTERS: dict[str, Callable[[List[str], List[tuple]], str]] = {
+        "text": _format_text,
+        "table": _format_table,
+        "csv": _format_csv,
+    }
 
     @staticmethod
     def _stringify(value: object) -> str:
-        if value is None:
-            return ""
-
-        if isinstance(value, (float, Decimal)):
-            val_float = float(value)
-            # If the number is very big (millions), no decimals
-            if abs(val_float) >= 1_000_000:
-                return f"{val_float:,.0f}"
-
-            # If it's effectively an integer, show as integer
-            if isinstance(value, float) and value.is_integer():
-                return f"{int(value)}"
-            if isinstance(value, Decimal) and value % 1 == 0:
-                return f"{int(value)}"
-
-            # Otherwise limit to 2 decimals
-            return f"{val_float:.2f}"
-
+        formatter = _STRINGIFIERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        # Subclasses (e.g. numpy floats) fall back to the isinstance checks
+        if isinstance(value, float):
+            return _stringify_float(value)
+        if isinstance(value, Decimal):
+            return _stringify_decimal(value)
         return str(value)
 
     def _slugify(self, value: str) -> str:
-        cleaned = re.sub(r"[^A-Za-z0-9_-]+", "_", value).strip("_")
+        cleaned = _SLUG_PATTERN.sub("_", value).strip("_")
         return cleaned.lower()
 
     def _create_project(self, name: str, *, description: str = "") -> Path:
@@ -398,6 +848,7 @@ class DuckDBQueryTool(Tool):
         manager = SchemaManager()
         manager.set_database(candidate)
         manager.set_project_metadata(display_name=display_name, description=description)
+        self.invalidate_discovery()
         return candidate
 
     @staticmethod
@@ -410,6 +861,25 @@ class DuckDBQueryTool(Tool):
             return value.hex()
         return str(value)
 
+    @classmethod
+    def _serialise_arrow(cls, table: "pa.Table") -> list[list[Any]]:
+        """Convert an Arrow table to JSON-ready rows, converting only columns that need it."""
+        column_values: list[list[Any]] = []
+        for field, column in zip(table.schema, table.columns):
+            values = column.to_pylist()
+            arrow_type = field.type
+            if not (
+                pa.types.is_integer(arrow_type)
+                or pa.types.is_floating(arrow_type)
+                or pa.types.is_boolean(arrow_type)
+                or pa.types.is_string(arrow_type)
+                or pa.types.is_large_string(arrow_type)
+                or pa.types.is_null(arrow_type)
+            ):
+                values = [cls._jsonify(value) for value in values]
+            column_values.append(values)
+        return [list(row) for row in zip(*column_values)]
+
     def execute_structured(
         self,
         sql: str,
@@ -417,6 +887,7 @@ class DuckDBQueryTool(Tool):
         database: Optional[str] = None,
         project: Optional[str] = None,
         result_limit: Optional[int] = None,
+        count_total_rows: bool = False,
     ) -> StructuredQueryResult:
         """
         Execute SQL and return structured results ready for JSON serialisation.
@@ -429,21 +900,32 @@ class DuckDBQueryTool(Tool):
             Optional hints for the DuckDB file to target.
         result_limit:
             Optional maximum number of rows to include in the response. When exceeded the data is truncated.
+        count_total_rows:
+            When a truncated read query should also report its exact ``row_count``. This runs the query a
+            second time, so by default ``row_count`` is only ``result_limit + 1``, meaning "more than
+            ``result_limit`` rows".
         """
 
         if not sql or not sql.strip():
             raise ValueError("SQL query is required.")
 
-        available = self._discover_databases()
-        target = self._resolve_database(database, project, available)
+        target = self._resolve_database(database, project)
 
         self.current_database = target
         self.schema_manager.set_database(target)
 
+        bounded_query = _as_read_query(sql) if result_limit is not None and result_limit >= 0 else None
         try:
-            with duckdb.connect(str(target)) as conn:
-                cursor = conn.execute(sql)
-                description = cursor.description
+            with self._connect(target) as conn:
+                if _modifies_database(sql):
+                    self._request_release(target)
+                if bounded_query is not None:
+                    # Only result_limit + 1 rows leave DuckDB; the extra row signals truncation.
+                    relation = conn.sql(bounded_query)
+                    cursor = relation.limit(result_limit + 1) if relation is not None else None
+                else:
+                    cursor = conn.execute(sql)
+                description = cursor.description if cursor is not None else None
                 if not description:
                     conn.commit()
                     return StructuredQueryResult(
@@ -456,20 +938,39 @@ class DuckDBQueryTool(Tool):
                         message="Statement executed successfully (no result set returned).",
                     )
 
-                columns = [column[0] for column in description]
-                fetched_rows = cursor.fetchall()
+                columns = list(map(_COLUMN_NAME, description))
+                use_arrow = pa is not None and all(
+                    str(column[1]).upper() in _ARROW_SAFE_TYPES or str(column[1]).upper().startswith("DECIMAL")
+                    for column in description
+                )
+                if use_arrow:
+                    # ``fetch_arrow_table`` was renamed ``to_arrow_table`` in newer DuckDB releases.
+                    fetch_arrow = getattr(cursor, "to_arrow_table", None) or cursor.fetch_arrow_table
+                    fetched_table = fetch_arrow()
+                    total_rows = fetched_table.num_rows
+                else:
+                    fetched_rows = cursor.fetchall()
+                    total_rows = len(fetched_rows)
+                if count_total_rows and bounded_query is not None and total_rows > result_limit:
+                    # Exact size on request, still without pulling the remaining rows into Python
+                    total_rows = relation.aggregate("count(*)").fetchone()[0]
         except duckdb.Error as exc:
             raise ValueError(f"DuckDB execution error: {exc}") from exc
 
-        total_rows = len(fetched_rows)
-        truncated = False
-        if result_limit is not None and result_limit >= 0 and total_rows > result_limit:
-            fetched_rows = fetched_rows[:result_limit]
-            truncated = True
-
-        serialised_rows = [
-            [self._jsonify(value) for value in row] for row in fetched_rows
-        ]
+        truncated = result_limit is not None and result_limit >= 0 and total_rows > result_limit
+        if use_arrow:
+            if truncated:
+                fetched_table = fetched_table.slice(0, result_limit)
+            serialised_rows = self._serialise_arrow(fetched_table)
+        else:
+            if truncated:
+                fetched_rows = fetched_rows[:result_limit]
+            if all(str(column[1]).upper() in _JSON_NATIVE_TYPES for column in description):
+                serialised_rows = [list(row) for row in fetched_rows]
+            else:
+                serialised_rows = [
+                    [self._jsonify(value) for value in row] for row in fetched_rows
+                ]
 
         return StructuredQueryResult(
             columns=columns,
@@ -494,25 +995,10 @@ class DuckDBQueryTool(Tool):
         if not self.current_database:
             raise ValueError("No DuckDB database selected. Choose a project first.")
 
-        table_types: list[str] = ["BASE TABLE"]
-        if include_views:
-            table_types.append("VIEW")
-
-        placeholders_tables = ", ".join("?" for _ in table_types)
-        schema_exclusions = ["information_schema", "pg_catalog"]
-        placeholders_schemas = ", ".join("?" for _ in schema_exclusions)
-
-        query = f"""
-            SELECT table_schema, table_name
-            FROM information_schema.tables
-            WHERE table_type IN ({placeholders_tables})
-              AND table_schema NOT IN ({placeholders_schemas})
-            ORDER BY lower(table_schema), lower(table_name), table_name
-        """
-
+        query = _LIST_TABLES_AND_VIEWS_SQL if include_views else _LIST_TABLES_SQL
         try:
-            with duckdb.connect(str(self.current_database)) as conn:
-                rows = conn.execute(query, table_types + schema_exclusions).fetchall()
+            with self._connect(self.current_database) as conn:
+                rows = conn.execute(query).fetchall()
         except duckdb.Error as exc:
             raise ValueError(f"Failed to read tables from DuckDB: {exc}") from exc
 
@@ -536,33 +1022,40 @@ class DuckDBQueryTool(Tool):
             return self.current_database.stem
         return None
 
-    @staticmethod
-    def _extract_tables(sql: str) -> List[str]:
-        if not sql:
-            return []
-        pattern = re.compile(r"\b(?:from|join)\s+([^\s;]+)", flags=re.IGNORECASE)
-        tables: list[str] = []
-        seen_lower: set[str] = set()
-        for match in pattern.findall(sql):
-            candidate = match.strip().strip(",")
-            candidate = candidate.strip("`\"[]")
-            if candidate:
-                table_name = candidate.split(".")[-1]
-                lowered = table_name.lower()
-                if lowered not in seen_lower:
-                    seen_lower.add(lowered)
-                    tables.append(table_name)
-        return tables
-
     def fetch_table_schema(self, table: str) -> List[dict[str, object]]:
         if not self.current_database:
             raise ValueError("No DuckDB database selected. Choose a project first.")
-        escaped = table.replace("'", "''")
         try:
-            with duckdb.connect(str(self.current_database)) as conn:
-                cursor = conn.execute(f"PRAGMA table_info('{escaped}')")
-                columns = [col[0] for col in cursor.description]
+            with self._connect(self.current_database) as conn:
+                cursor = conn.execute(_TABLE_SCHEMA_QUERY, [table])
+                columns = list(map(_COLUMN_NAME, cursor.description))
                 rows = cursor.fetchall()
         except duckdb.Error as exc:
             raise ValueError(f"Failed to inspect table '{table}': {exc}") from exc
         return [dict(zip(columns, row)) for row in rows]
+
+    def fetch_tables_schema(self, tables: Iterable[str]) -> dict[str, List[dict[str, object]]]:
+        """
+        Return ``fetch_table_schema`` rows for several tables over one connection cursor.
+
+        The result is keyed by the names as given; tables that do not exist are omitted.
+        """
+
+        if not self.current_database:
+            raise ValueError("No DuckDB database selected. Choose a project first.")
+        requested = list(dict.fromkeys(tables))
+        schemas: dict[str, List[dict[str, object]]] = {}
+        if not requested:
+            return schemas
+        try:
+            with self._connect(self.current_database) as conn:
+                for table in requested:
+                    try:
+                        cursor = conn.execute(_TABLE_SCHEMA_QUERY, [table])
+                    except duckdb.CatalogException:
+                        continue
+                    columns = list(map(_COLUMN_NAME, cursor.description))
+                    schemas[table] = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except duckdb.Error as exc:
+            raise ValueError(f"Failed to inspect tables: {exc}") from exc
+        return schemas
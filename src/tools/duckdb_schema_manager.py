@@ -1,11 +1,57 @@
 from __future__ import annotations
 
 import json
+import os
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Set
+from typing import Any, Iterable, Iterator, List, Optional, Set
 from uuid import uuid4
 
+try:  # Optional: faster serialisation of the schema sidecar file.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when dependency is missing
+    orjson = None  # type: ignore
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialise ``data`` as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (a TypeError): e.g. integers beyond 64 bits; the stdlib copes
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(payload: bytes) -> Any:
+    """Parse UTF-8 JSON bytes; both parsers raise ``json.JSONDecodeError`` (or a subclass) on bad input."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Field metadata reported by fields_needing_input when empty, in reporting order.
+_REQUIRED_FIELD_KEYS = ("short_description", "long_description", "data_type", "nullability")
+
+
+@lru_cache(maxsize=32)
+def _mermaid_arrow(rel_type: str) -> str:
+    """Map a relationship type such as ``one_to_many`` to its Mermaid ER arrow (few distinct values, so cached)."""
+    rel_type = rel_type.lower()
+    if "many" in rel_type and "one" in rel_type:
+        if rel_type.startswith("many"):
+            return "}o--||"
+        return "||--o{"
+    if "many" in rel_type:
+        return "}o--o{"
+    if "one" in rel_type:
+        return "||--||"
+    return "}o--o{"
+
 
 class SchemaManager:
     """Handles persistence and summarisation of DuckDB schema metadata."""
@@ -14,38 +60,63 @@ class SchemaManager:
         self.project_path: Optional[Path] = None
         self.schema_path: Optional[Path] = None
         self.schema: dict[str, Any] = {}
+        # Nesting depth of batch() blocks and whether a write was deferred inside them
+        self._batch_depth = 0
+        self._dirty = False
+        # Per section ("diagrams"/"queries"): (list indexed, its length then, id -> first position)
+        self._id_index: dict[str, tuple[list[dict[str, Any]], int, dict[Any, int]]] = {}
+        # id(mapping) -> (mapping, lower-case key -> key) for case-insensitive table/field lookups
+        self._key_index: dict[int, tuple[dict[str, Any], dict[str, str]]] = {}
+        # Bumped on every load and save; get_schema_json reuses its text while the version is unchanged
+        self._schema_version = 0
+        self._schema_json_cache: Optional[tuple[int, str]] = None
+        # Bytes last read from or written to schema_path, with the file's (mtime_ns, size) at that moment
+        self._saved_state: Optional[tuple[bytes, tuple[int, int]]] = None
 
     def set_database(self, db_path: Path) -> None:
+        if self._dirty and self.schema_path:
+            # Persist edits deferred by batch() before they are replaced by the reload below
+            self._write()
         self.project_path = db_path.resolve()
         schema_filename = f"{self.project_path.stem}.schema.json"
         self.schema_path = self.project_path.parent / schema_filename
+        self._saved_state = None
+        self._key_index.clear()
+        self._schema_version += 1
+        # Only write back when the file was unreadable or a default below had to be filled in
+        changed = False
         if self.schema_path.exists():
+            payload = self.schema_path.read_bytes()
             try:
-                self.schema = json.loads(self.schema_path.read_text(encoding="utf-8"))
+                self.schema = _load_json(payload)
             except json.JSONDecodeError:
                 self.schema = self._empty_schema()
+                changed = True
+            else:
+                self._remember_saved(payload)
         else:
             self.schema = self._empty_schema()
             self._save()
 
         # Ensure modern metadata fields exist
-        project_id = self.project_path.stem if self.project_path else "unknown_project"
+        project_id = self.project_path.stem
         display_name = self.schema.get("project_display_name")
         if not isinstance(display_name, str) or not display_name.strip():
             self.schema["project_display_name"] = self.schema.get("project") or project_id
-        if "project_description" not in self.schema or not isinstance(self.schema["project_description"], str):
-            self.schema["project_description"] = ""
-        if "project" not in self.schema or not isinstance(self.schema["project"], str):
-            self.schema["project"] = project_id
-        if "version" not in self.schema or not isinstance(self.schema["version"], str):
-            self.schema["version"] = "1.0.0"
-        if "query_instructions" not in self.schema or not isinstance(self.schema["query_instructions"], str):
-            self.schema["query_instructions"] = ""
-        if not isinstance(self.schema.get("diagrams"), list):
-            self.schema["diagrams"] = []
-        if not isinstance(self.schema.get("queries"), list):
-            self.schema["queries"] = []
-        self._save()
+            changed = True
+        for key, expected_type, default in (
+            ("project_description", str, ""),
+            ("project", str, project_id),
+            ("version", str, "1.0.0"),
+            ("query_instructions", str, ""),
+            ("diagrams", list, []),
+            ("queries", list, []),
+        ):
+            if not isinstance(self.schema.get(key), expected_type):
+                self.schema[key] = default
+                changed = True
+        if changed:
+            self._save()
 
     def _empty_schema(self) -> dict[str, Any]:
         project = self.project_path.stem if self.project_path else "unknown_project"
@@ -63,13 +134,56 @@ class SchemaManager:
     def _save(self) -> None:
         if not self.schema_path:
             raise RuntimeError("Schema path is undefined; call set_database first.")
-        self.schema_path.write_text(json.dumps(self.schema, indent=2, ensure_ascii=False), encoding="utf-8")
+        self._schema_version += 1
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        self._dirty = False
+        payload = _dump_json(self.schema)
+        # Skip rewriting identical content, unless the file changed since we last read or wrote it
+        if self._saved_state is not None and self._saved_state[0] == payload:
+            if self._saved_state[1] == self._file_signature():
+                return
+        # Write a sibling file and rename it over the original so readers never see a partial file
+        temp_path = self.schema_path.with_name(self.schema_path.name + ".tmp")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, self.schema_path)
+        self._remember_saved(payload)
+
+    def _remember_saved(self, payload: bytes) -> None:
+        signature = self._file_signature()
+        self._saved_state = (payload, signature) if signature is not None else None
+
+    def _file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self.schema_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the outermost ``batch()`` block exits, so N edits cost one write."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty and self.schema_path:
+                self._write()
 
     # Public operations -------------------------------------------------
     def get_schema_json(self) -> str:
         if not self.schema:
             return "{}"
-        return json.dumps(self.schema, indent=2, ensure_ascii=False)
+        cached = self._schema_json_cache
+        if cached is None or cached[0] != self._schema_version:
+            cached = (self._schema_version, _dump_json(self.schema).decode("utf-8"))
+            self._schema_json_cache = cached
+        return cached[1]
 
     def list_tables(self) -> List[str]:
         tables = self.schema.get("tables", {})
@@ -126,19 +240,17 @@ class SchemaManager:
         if not tables:
             return {}
 
-        target_tables: dict[str, dict] = {}
+        target_tables: dict[str, dict] = tables
         if table:
             record = self._find_table_record(table, tables)
             if not record:
                 return {}
             target_tables = {record["name"]: record["data"]}
-        else:
-            target_tables = {name: data for name, data in tables.items()}
 
         result: dict[str, List[str]] = {}
         for table_name, data in target_tables.items():
-            fields = data.get("fields") or {}
-            result[table_name] = sorted(fields.keys())
+            fields = data.get("fields")
+            result[table_name] = sorted(fields) if fields else []
         return result
 
     def set_project_description(self, description: str) -> None:
@@ -200,17 +312,11 @@ class SchemaManager:
         }
         diagrams = self.schema["diagrams"]
         assert isinstance(diagrams, list)
-        if diagram_id:
-            replaced = False
-            for index, existing in enumerate(diagrams):
-                if existing.get("id") == diagram_id:
-                    diagrams[index] = diagram_record
-                    replaced = True
-                    break
-            if not replaced:
-                diagrams.append(diagram_record)
+        position = self._record_position("diagrams", diagrams, diagram_id) if diagram_id else None
+        if position is not None:
+            diagrams[position] = diagram_record
         else:
-            diagrams.append(diagram_record)
+            self._append_record("diagrams", diagrams, diagram_record)
         self._save()
         return diagram_record
 
@@ -218,21 +324,19 @@ class SchemaManager:
         diagrams = self.schema.get("diagrams")
         if not isinstance(diagrams, list):
             return False
-        initial_count = len(diagrams)
-        self.schema["diagrams"] = [diagram for diagram in diagrams if diagram.get("id") != diagram_id]
-        if len(self.schema["diagrams"]) != initial_count:
-            self._save()
-            return True
-        return False
+        position = self._record_position("diagrams", diagrams, diagram_id)
+        if position is None:
+            return False
+        del diagrams[position]
+        self._save()
+        return True
 
     def get_diagram(self, diagram_id: str) -> dict[str, Any] | None:
         diagrams = self.schema.get("diagrams")
         if not isinstance(diagrams, list):
             return None
-        for diagram in diagrams:
-            if diagram.get("id") == diagram_id:
-                return diagram
-        return None
+        position = self._record_position("diagrams", diagrams, diagram_id)
+        return diagrams[position] if position is not None else None
 
     # Query persistence -------------------------------------------------
     def _ensure_query_section(self) -> list[dict[str, Any]]:
@@ -284,17 +388,11 @@ class SchemaManager:
 
         queries = self.schema["queries"]
         assert isinstance(queries, list)
-        if query_id:
-            replaced = False
-            for index, existing in enumerate(queries):
-                if existing.get("id") == query_id:
-                    queries[index] = record
-                    replaced = True
-                    break
-            if not replaced:
-                queries.append(record)
+        position = self._record_position("queries", queries, query_id) if query_id else None
+        if position is not None:
+            queries[position] = record
         else:
-            queries.append(record)
+            self._append_record("queries", queries, record)
         self._save()
         return record
 
@@ -302,21 +400,19 @@ class SchemaManager:
         queries = self.schema.get("queries")
         if not isinstance(queries, list):
             return False
-        initial_count = len(queries)
-        self.schema["queries"] = [query for query in queries if query.get("id") != query_id]
-        if len(self.schema["queries"]) != initial_count:
-            self._save()
-            return True
-        return False
+        position = self._record_position("queries", queries, query_id)
+        if position is None:
+            return False
+        del queries[position]
+        self._save()
+        return True
 
     def get_query(self, query_id: str) -> dict[str, Any] | None:
         queries = self.schema.get("queries")
         if not isinstance(queries, list):
             return None
-        for query in queries:
-            if query.get("id") == query_id:
-                return query
-        return None
+        position = self._record_position("queries", queries, query_id)
+        return queries[position] if position is not None else None
 
     def update_table(
         self,
@@ -388,12 +484,7 @@ class SchemaManager:
         fields = table_record.get("fields", {})
 
         # Resolve actual key respecting case
-        actual_field = None
-        for key in fields.keys():
-            if key == field or key.lower() == field.lower():
-                actual_field = key
-                break
-
+        actual_field = self._match_key(fields, field)
         if actual_field is None:
             return False
 
@@ -427,16 +518,8 @@ class SchemaManager:
 
         table_record = self._ensure_table(table)
         fields = table_record.setdefault("fields", {})
-        if old_name not in fields and old_name.lower() not in (name.lower() for name in fields):
-            raise ValueError(f"Field '{old_name}' not found in table '{table}'.")
-
         # Resolve actual key respecting case
-        actual_old = None
-        for key in fields.keys():
-            if key == old_name or key.lower() == old_name.lower():
-                actual_old = key
-                break
-
+        actual_old = self._match_key(fields, old_name)
         if actual_old is None:
             raise ValueError(f"Field '{old_name}' not found in table '{table}'.")
 
@@ -483,6 +566,7 @@ class SchemaManager:
         return rel
 
     def set_relationships(self, table: str, relationships: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        existed = bool((self.schema.get("tables") or {}).get(table))
         record = self._ensure_table(table)
         normalised: list[dict[str, Any]] = []
         for rel in relationships:
@@ -500,6 +584,10 @@ class SchemaManager:
                     "type": rel_type or "unspecified",
                 }
             )
+        current = record.get("relationships")
+        if existed and current == normalised:
+            # Re-submitting the stored relationships: nothing to change or write
+            return current
         record["relationships"] = normalised
         self._save()
         return normalised
@@ -525,17 +613,26 @@ class SchemaManager:
             if fields:
                 field_lines = []
                 for field_name, field_info in fields.items():
-                    summary_bits = []
-                    if field_info.get("short_description"):
-                        summary_bits.append(field_info["short_description"])
-                    if field_info.get("data_type"):
-                        summary_bits.append(f"Type: {field_info['data_type']}")
-                    if field_info.get("nullability"):
-                        summary_bits.append(f"Nullability: {field_info['nullability']}")
-                    if field_info.get("values"):
-                        values_text = ", ".join(f"{k}={v}" for k, v in field_info["values"].items())
-                        summary_bits.append(f"Values: {values_text}")
-                    summary = "; ".join(summary_bits) if summary_bits else ""
+                    get = field_info.get
+                    short = get("short_description")
+                    data_type = get("data_type")
+                    nullability = get("nullability")
+                    values = get("values")
+                    if short and data_type and nullability and not values:
+                        # Fully documented fields are the common case; format them without the parts list
+                        summary = f"{short}; Type: {data_type}; Nullability: {nullability}"
+                    else:
+                        summary_bits = []
+                        if short:
+                            summary_bits.append(short)
+                        if data_type:
+                            summary_bits.append(f"Type: {data_type}")
+                        if nullability:
+                            summary_bits.append(f"Nullability: {nullability}")
+                        if values:
+                            values_text = ", ".join(f"{k}={v}" for k, v in values.items())
+                            summary_bits.append(f"Values: {values_text}")
+                        summary = "; ".join(summary_bits)
                     field_lines.append(f"  - {field_name}: {summary}".rstrip(": "))
                 if field_lines:
                     line += "\n" + "\n".join(field_lines)
@@ -562,6 +659,30 @@ class SchemaManager:
         return "\n".join(lines)
 
     # Internal helpers --------------------------------------------------
+    def _record_position(self, section: str, records: list[dict[str, Any]], record_id: Any) -> Optional[int]:
+        """Return the position of the first record with ``record_id``, using an id index rebuilt on demand.
+
+        The index is trusted only for the same list object at the same length, and every hit is checked,
+        so reloads and deletions (which build new lists) simply trigger a rebuild.
+        """
+        cached = self._id_index.get(section)
+        if cached is not None and cached[0] is records and cached[1] == len(records):
+            position = cached[2].get(record_id)
+            if position is None or records[position].get("id") == record_id:
+                return position
+        positions: dict[Any, int] = {}
+        for position, record in enumerate(records):
+            positions.setdefault(record.get("id"), position)
+        self._id_index[section] = (records, len(records), positions)
+        return positions.get(record_id)
+
+    def _append_record(self, section: str, records: list[dict[str, Any]], record: dict[str, Any]) -> None:
+        records.append(record)
+        cached = self._id_index.get(section)
+        if cached is not None and cached[0] is records and cached[1] == len(records) - 1:
+            cached[2].setdefault(record.get("id"), len(records) - 1)
+            self._id_index[section] = (records, len(records), cached[2])
+
     def _ensure_table(self, table: str) -> dict[str, Any]:
         if "tables" not in self.schema:
             self.schema["tables"] = {}
@@ -573,13 +694,30 @@ class SchemaManager:
         return record
 
     def _find_table_record(self, table: str, tables: dict) -> Optional[dict]:
-        if table in tables:
-            return {"name": table, "data": tables[table]}
-        lowered = table.lower()
-        for key, value in tables.items():
-            if key.lower() == lowered:
-                return {"name": key, "data": value}
-        return None
+        key = self._match_key(tables, table)
+        if key is None:
+            return None
+        return {"name": key, "data": tables[key]}
+
+    def _match_key(self, mapping: dict[str, Any], key: str) -> Optional[str]:
+        """Return the key of ``mapping`` equal to ``key``, else the first one matching it case-insensitively.
+
+        Lower-case indexes are cached per mapping object; a cached hit is only used if the key still exists,
+        and anything else rebuilds the index, so edits made behind the manager's back are picked up.
+        """
+        if key in mapping:
+            return key
+        lowered = key.lower()
+        cached = self._key_index.get(id(mapping))
+        if cached is not None and cached[0] is mapping:
+            actual = cached[1].get(lowered)
+            if actual is not None and actual in mapping:
+                return actual
+        index: dict[str, str] = {}
+        for name in mapping:
+            index.setdefault(name.lower(), name)
+        self._key_index[id(mapping)] = (mapping, index)
+        return index.get(lowered)
 
     def get_table(self, table: str) -> Optional[dict]:
         tables = self.schema.get("tables", {})
@@ -593,13 +731,8 @@ class SchemaManager:
         if not table_record:
             return None
         fields = table_record.get("fields", {})
-        if field in fields:
-            return fields[field]
-        lowered = field.lower()
-        for key, value in fields.items():
-            if key.lower() == lowered:
-                return value
-        return None
+        key = self._match_key(fields, field)
+        return fields[key] if key is not None else None
 
     def fields_needing_input(self, table: Optional[str] = None) -> list[dict[str, Any]]:
         tables = self.schema.get("tables", {})
@@ -615,15 +748,8 @@ class SchemaManager:
         for table_name, record in items:
             fields = record.get("fields", {})
             for field_name, metadata in fields.items():
-                missing: list[str] = []
-                if not metadata.get("short_description"):
-                    missing.append("short_description")
-                if not metadata.get("long_description"):
-                    missing.append("long_description")
-                if not metadata.get("data_type"):
-                    missing.append("data_type")
-                if not metadata.get("nullability"):
-                    missing.append("nullability")
+                get = metadata.get
+                missing = [key for key in _REQUIRED_FIELD_KEYS if not get(key)]
                 if missing:
                     pending.append({"table": table_name, "field": field_name, "missing": missing})
         return pending
@@ -653,19 +779,28 @@ class SchemaManager:
         if fields:
             lines.append("Fields:")
             for field_name, metadata in fields.items():
-                parts = []
-                if metadata.get("short_description"):
-                    parts.append(metadata["short_description"])
-                if metadata.get("data_type"):
-                    parts.append(f"Type: {metadata['data_type']}")
-                if metadata.get("nullability"):
-                    parts.append(f"Nullability: {metadata['nullability']}")
-                if metadata.get("values"):
-                    values_text = ", ".join(f"{k}={v}" for k, v in metadata["values"].items())
-                    parts.append(f"Values: {values_text}")
-                if metadata.get("long_description"):
-                    parts.append(f"Details: {metadata['long_description']}")
-                summary = "; ".join(parts) if parts else "No details recorded."
+                get = metadata.get
+                short = get("short_description")
+                data_type = get("data_type")
+                nullability = get("nullability")
+                values = get("values")
+                long = get("long_description")
+                if short and data_type and nullability and not values and not long:
+                    summary = f"{short}; Type: {data_type}; Nullability: {nullability}"
+                else:
+                    parts = []
+                    if short:
+                        parts.append(short)
+                    if data_type:
+                        parts.append(f"Type: {data_type}")
+                    if nullability:
+                        parts.append(f"Nullability: {nullability}")
+                    if values:
+                        values_text = ", ".join(f"{k}={v}" for k, v in values.items())
+                        parts.append(f"Values: {values_text}")
+                    if long:
+                        parts.append(f"Details: {long}")
+                    summary = "; ".join(parts) if parts else "No details recorded."
                 lines.append(f"  - {field_name}: {summary}")
         relationships = data.get("relationships") or []
         if relationships:
@@ -683,7 +818,7 @@ class SchemaManager:
     def collect_related_tables(self, base_tables: Iterable[str]) -> Set[str]:
         tables = self.schema.get("tables", {})
         resolved: Set[str] = set()
-        queue: List[str] = []
+        queue: deque[str] = deque()
         for table in base_tables:
             record = self._find_table_record(table, tables)
             if record:
@@ -692,11 +827,12 @@ class SchemaManager:
                 queue.append(name)
 
         while queue:
-            current = queue.pop(0)
-            record = self._find_table_record(current, tables)
-            if not record:
+            # Queued names are already canonical keys of ``tables``
+            current = queue.popleft()
+            record_data = tables.get(current)
+            if not record_data:
                 continue
-            relationships = record["data"].get("relationships") or []
+            relationships = record_data.get("relationships") or []
             for rel in relationships:
                 related_table = rel.get("related_table")
                 if not related_table:
@@ -724,11 +860,15 @@ class SchemaManager:
         if not selected_tables:
             return "%% No tables documented; Mermaid ER diagram cannot be generated."
 
+        # Sorted and resolved once, then shared by the entity and relationship passes
+        ordered_records = [
+            (table_name, record)
+            for table_name in sorted(selected_tables)
+            if (record := tables.get(table_name))
+        ]
+
         lines = ["erDiagram"]
-        for table_name in sorted(selected_tables):
-            record = tables.get(table_name)
-            if not record:
-                continue
+        for table_name, record in ordered_records:
             lines.append(f"  {table_name} {{")
             fields = record.get("fields", {})
             for field_name, metadata in fields.items():
@@ -741,17 +881,13 @@ class SchemaManager:
                 lines.append(f"    {data_type} {field_name} \"{short_desc}\"")
             lines.append("  }")
 
-        for table_name in sorted(selected_tables):
-            record = tables.get(table_name)
-            if not record:
-                continue
+        for table_name, record in ordered_records:
             relationships = record.get("relationships") or []
             for rel in relationships:
                 related_table = rel.get("related_table")
                 if not related_table or related_table not in selected_tables:
                     continue
-                related_record = tables.get(related_table)
-                if not related_record:
+                if not tables.get(related_table):
                     continue
                 left = table_name
                 right = related_table
@@ -762,13 +898,4 @@ class SchemaManager:
 
     @staticmethod
     def _relationship_to_mermaid(rel: dict) -> str:
-        rel_type = (rel.get("type") or "").lower()
-        if "many" in rel_type and "one" in rel_type:
-            if rel_type.startswith("many"):
-                return "}o--||"
-            return "||--o{"
-        if "many" in rel_type:
-            return "}o--o{"
-        if "one" in rel_type:
-            return "||--||"
-        return "}o--o{"
+        return _mermaid_arrow(rel.get("type") or "")
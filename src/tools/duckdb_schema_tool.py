@@ -1,14 +1,47 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+import re
+import time
+from typing import Any, Callable, List, Optional
 
 from smolagents import Tool
 
+try:  # Optional: faster parsing of large fields_json payloads.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when dependency is missing
+    orjson = None  # type: ignore
+
 from .duckdb_query_tool import DuckDBQueryTool
+from .duckdb_schema_manager import SchemaManager
 
 __all__ = ["DuckDBSchemaTool"]
 
+# UUID format: XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX
+_UUID_PATTERN = re.compile(r"[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}")
+_GENERIC_TYPES = frozenset({"VARCHAR", "TEXT", "STRING", "UNKNOWN"})
+# Minimum seconds between progress callbacks in the per-field/per-table loops.
+_PROGRESS_INTERVAL = 0.1
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote ``name`` as a single DuckDB identifier, escaping embedded double quotes."""
+    if not name:
+        raise ValueError("Identifier must not be empty.")
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _parse_json(text: str) -> Any:
+    """Parse JSON text with orjson when it is installed, deferring to the stdlib for input orjson rejects."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # e.g. NaN literals or integers beyond 64 bits, which json accepts
+            pass
+    return json.loads(text)
+
 
 class DuckDBSchemaTool(Tool):
     """Tool that manages schema documentation for DuckDB projects."""
@@ -99,6 +132,20 @@ class DuckDBSchemaTool(Tool):
         }
     }
 
+    _ACTIONS = {
+        "update_fields_batch": "_do_update_fields_batch",
+        "infer_nullability": "_do_infer_nullability",
+        "list_tables": "_do_list_tables",
+        "list_fields": "_do_list_fields",
+        "get_table_info": "_do_get_table_info",
+        "list_saved_queries": "_do_list_saved_queries",
+        "get_full_schema": "_do_get_full_schema",
+        "update_field": "_do_update_field",
+        "update_table": "_do_update_table",
+        "update_field_description": "_do_update_field_description",
+        "search_fields": "_do_search_fields",
+    }
+
     def __init__(self, query_tool: DuckDBQueryTool) -> None:
         super().__init__()
         self.query_tool = query_tool
@@ -123,69 +170,77 @@ class DuckDBSchemaTool(Tool):
         self._ensure_project_context()
         manager = self.query_tool.schema_manager
 
-        normalized_action = action.strip().lower()
-
         # Handle backward compatibility for description -> long_description
         if description and not long_description:
             long_description = description
 
-        # Batch update fields
-        if normalized_action == "update_fields_batch":
-            if not table_name or not fields_json:
-                raise ValueError("table_name and fields_json are required for update_fields_batch.")
-
-            try:
-                fields_data = json.loads(fields_json)
-                if not isinstance(fields_data, list):
-                    raise ValueError("fields_json must be a JSON list of objects.")
+        handler = self._ACTIONS.get(action.strip().lower())
+        if handler is None:
+            raise ValueError(
+                f"Unknown action '{action}'. Supported: list_tables, list_fields, "
+                "get_table_info, list_saved_queries, get_full_schema, update_field, update_table, update_fields_batch."
+            )
+        return getattr(self, handler)(
+            manager,
+            table_name=table_name,
+            field_name=field_name,
+            query=query,
+            short_description=short_description,
+            long_description=long_description,
+            data_type=data_type,
+            nullability=nullability,
+            fields_json=fields_json,
+            ignored=ignored,
+        )
 
-                results = []
+    def _do_update_fields_batch(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        fields_json: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Batch update fields."""
+        if not table_name or not fields_json:
+            raise ValueError("table_name and fields_json are required for update_fields_batch.")
+
+        try:
+            fields_data = _parse_json(fields_json)
+            if not isinstance(fields_data, list):
+                raise ValueError("fields_json must be a JSON list of objects.")
+
+            # Sample every generically typed field in one query instead of one query per field
+            probe_columns = [
+                f_name
+                for field_item in fields_data
+                if (f_name := field_item.get("name") or field_item.get("field_name"))
+                and (field_item.get("data_type") or "").upper() in _GENERIC_TYPES
+            ]
+            samples = self._sample_distinct_values(table_name, probe_columns)
+
+            results = []
+            report_progress = self._progress_reporter()
+            with manager.batch():
                 for field_item in fields_data:
                     f_name = field_item.get("name") or field_item.get("field_name")
                     if not f_name:
                         continue
 
-                    # Report progress if agent callback is available
-                    if hasattr(self, "_agent_ref") and hasattr(self._agent_ref, "_on_step") and self._agent_ref._on_step:
-                        self._agent_ref._on_step(f"Updating field {table_name}.{f_name}...")
+                    report_progress(f"Updating field {table_name}.{f_name}...")
 
                     # If data_type is not provided or is generic, try to infer from sample data
                     provided_type = field_item.get("data_type")
                     inferred_type = provided_type
-                    
-                    if provided_type and provided_type.upper() in ["VARCHAR", "TEXT", "STRING", "UNKNOWN"]:
-                        try:
-                            # Sample data to infer more accurate type
-                            sample_sql = (
-                                f'SELECT DISTINCT "{f_name}" FROM "{table_name}" '
-                                f'WHERE "{f_name}" IS NOT NULL LIMIT 10'
-                            )
-                            sample_result = self.query_tool.execute_structured(sample_sql)
-                            
-                            if sample_result and hasattr(sample_result, 'rows') and sample_result.rows:
-                                sample_values = [str(row[0]) for row in sample_result.rows if row]
-                                
-                                # Check for UUID pattern
-                                uuid_pattern_count = 0
-                                for val in sample_values:
-                                    # UUID format: XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX
-                                    parts = val.split('-')
-                                    if len(parts) == 5 and len(parts[0]) == 8 and len(parts[1]) == 4 and \
-                                       len(parts[2]) == 4 and len(parts[3]) == 4 and len(parts[4]) == 12:
-                                        try:
-                                            # Check if all parts are hex
-                                            all(int(part, 16) for part in parts)
-                                            uuid_pattern_count += 1
-                                        except ValueError:
-                                            pass
-                                
-                                # If most values look like UUIDs, use UUID type
-                                if uuid_pattern_count >= len(sample_values) * 0.8:
-                                    inferred_type = "UUID"
-                        except Exception as e:
-                            # If sampling fails, use provided type or default
-                            print(f"Warning: Could not sample data for {table_name}.{f_name}: {e}")
-                            pass
+
+                    sample_values = samples.get(f_name)
+                    if sample_values:
+                        # Check for UUID pattern
+                        uuid_pattern_count = sum(1 for val in sample_values if _UUID_PATTERN.fullmatch(val))
+
+                        # If most values look like UUIDs, use UUID type
+                        if uuid_pattern_count >= len(sample_values) * 0.8:
+                            inferred_type = "UUID"
 
                     manager.update_field(
                         table_name,
@@ -197,388 +252,496 @@ class DuckDBSchemaTool(Tool):
                     )
                     results.append(f_name)
 
-                return {"result": f"Updated metadata for {len(results)} fields in {table_name}: {', '.join(results)}"}
-            except Exception as e:
-                return {"result": f"Failed to batch update fields: {str(e)}"}
-
-        # Infer nullability for all fields in a table
-        if normalized_action == "infer_nullability":
-            if not table_name:
-                raise ValueError("table_name is required for infer_nullability action.")
-
-            try:
-                # 1. Get all fields
-                columns = self.query_tool.fetch_table_schema(table_name)
-                if not columns:
-                    return {"result": f"Table {table_name} not found or has no columns."}
-
-                # 2. Build query to count nulls for each column
-                select_parts = []
-                col_names = []
-                for col in columns:
-                    name = col.get('name')
-                    if name:
-                        col_names.append(name)
-                        # Use SUM(CASE...) to count nulls
-                        select_parts.append(f'SUM(CASE WHEN "{name}" IS NULL THEN 1 ELSE 0 END) as "{name}"')
-
-                if not select_parts:
-                    return {"result": "No columns found to check."}
-
-                sql = f'SELECT {", ".join(select_parts)} FROM "{table_name}"'
-                
-                # 3. Execute query
-                result = self.query_tool.execute_structured(sql)
-                
-                if not result or not result.rows:
-                    return {"result": "Failed to execute nullability check query."}
-
-                # 4. Process results and update metadata
-                row = result.rows[0]
-                updates = []
-                
-                for i, count in enumerate(row):
-                    col_name = result.columns[i]
+            return {"result": f"Updated metadata for {len(results)} fields in {table_name}: {', '.join(results)}"}
+        except Exception as e:
+            return {"result": f"Failed to batch update fields: {str(e)}"}
 
-                    # Report progress
-                    if hasattr(self, "_agent_ref") and hasattr(self._agent_ref, "_on_step") and self._agent_ref._on_step:
-                        self._agent_ref._on_step(f"Updating nullability for {table_name}.{col_name}...")
+    def _do_infer_nullability(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Infer nullability for all fields in a table."""
+        if not table_name:
+            raise ValueError("table_name is required for infer_nullability action.")
+
+        try:
+            # 1. Get all fields
+            columns = self.query_tool.fetch_table_schema(table_name)
+            if not columns:
+                return {"result": f"Table {table_name} not found or has no columns."}
+
+            # 2. Build query to count nulls for each column, plus the table's row count
+            select_parts = ['COUNT(*) AS "__total__"']
+            col_names = []
+            for col in columns:
+                name = col.get('name')
+                if name:
+                    col_names.append(name)
+                    quoted = _quote_identifier(name)
+                    select_parts.append(f'COUNT(*) FILTER (WHERE {quoted} IS NULL) AS {quoted}')
+
+            if not col_names:
+                return {"result": "No columns found to check."}
+
+            sql = f'SELECT {", ".join(select_parts)} FROM {_quote_identifier(table_name)}'
+
+            # 3. Execute query
+            result = self.query_tool.execute_structured(sql)
+
+            if not result or not result.rows:
+                return {"result": "Failed to execute nullability check query."}
+
+            # 4. Process results and update metadata
+            total, *null_counts = result.rows[0]
+            updates = []
+
+            report_progress = self._progress_reporter()
+            with manager.batch():
+                for col_name, count in zip(col_names, null_counts):
+                    report_progress(f"Updating nullability for {table_name}.{col_name}...")
 
                     has_nulls = count > 0
                     nullability = "NULL" if has_nulls else "NOT NULL"
-                    
+
                     manager.update_field(
                         table_name,
                         col_name,
                         nullability=nullability
                     )
-                    updates.append(f"{col_name}: {nullability} ({count} nulls)")
+                    updates.append(f"{col_name}: {nullability} ({count}/{total} nulls)")
 
-                return {"result": f"Inferred nullability for {len(updates)} fields in {table_name}:\n" + "\n".join(updates)}
+            return {"result": f"Inferred nullability for {len(updates)} fields in {table_name}:\n" + "\n".join(updates)}
 
-            except Exception as e:
-                return {"result": f"Failed to infer nullability: {str(e)}"}
+        except Exception as e:
+            return {"result": f"Failed to infer nullability: {str(e)}"}
 
-        # List all tables with descriptions
-        if normalized_action == "list_tables":
-            tables = manager.list_tables()
-            if not tables:
-                # Fallback to actual DuckDB tables if schema is empty
-                try:
-                    db_tables = self.query_tool.list_tables_in_database()
-                    if db_tables:
-                        lines = [f"- {table}" for table in db_tables]
-                        return {"result": "Available tables:\n" + "\n".join(lines)}
-                except Exception:
-                    pass
-                return {"result": "No tables found in database."}
-
-            lines = []
-            for table in tables:
-                table_record = manager.get_table(table) or {}
-                short_desc = table_record.get("short_description") or ""
-                field_count = len(table_record.get("fields") or {})
-                if short_desc:
-                    lines.append(f"- {table}: {short_desc} ({field_count} documented fields)")
-                else:
-                    lines.append(f"- {table} ({field_count} documented fields)")
-            return {"result": "Available tables:\n" + "\n".join(lines)}
-
-        # List fields for a specific table
-        if normalized_action == "list_fields":
-            if not table_name:
-                raise ValueError("table_name is required for list_fields action.")
-
-            # 1. Get actual fields from DuckDB
-            db_fields = {}
+    def _do_list_tables(
+        self,
+        manager: SchemaManager,
+        **_: Any,
+    ) -> dict[str, str]:
+        """List all tables with descriptions."""
+        tables = manager.list_tables()
+        if not tables:
+            # Fallback to actual DuckDB tables if schema is empty
             try:
-                columns = self.query_tool.fetch_table_schema(table_name)
-                for col in columns:
-                    name = col.get('name')
-                    if name:
-                        db_fields[str(name).lower()] = {
-                            "name": name,
-                            "type": col.get('type', col.get('column_type', 'unknown'))
-                        }
+                db_tables = self.query_tool.list_tables_in_database()
+                if db_tables:
+                    lines = [f"- {table}" for table in db_tables]
+                    return {"result": "Available tables:\n" + "\n".join(lines)}
             except Exception:
-                # If table doesn't exist in DB, we might still have documentation for it
                 pass
+            return {"result": "No tables found in database."}
+
+        lines = []
+        for table in tables:
+            table_record = manager.get_table(table) or {}
+            short_desc = table_record.get("short_description") or ""
+            field_count = len(table_record.get("fields") or ())
+            if short_desc:
+                lines.append(f"- {table}: {short_desc} ({field_count} documented fields)")
+            else:
+                lines.append(f"- {table} ({field_count} documented fields)")
+        return {"result": "Available tables:\n" + "\n".join(lines)}
+
+    def _do_list_fields(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """List fields for a specific table."""
+        if not table_name:
+            raise ValueError("table_name is required for list_fields action.")
+
+        # 1. Get actual fields from DuckDB
+        db_fields = {}
+        try:
+            columns = self.query_tool.fetch_table_schema(table_name)
+            for col in columns:
+                name = col.get('name')
+                if name:
+                    db_fields[str(name).lower()] = {
+                        "name": name,
+                        "type": col.get('type', col.get('column_type', 'unknown'))
+                    }
+        except Exception:
+            # If table doesn't exist in DB, we might still have documentation for it
+            pass
+
+        # 2. Get documented fields
+        table_record = manager.get_table(table_name)
+        doc_fields = {}
+        if table_record and table_record.get("fields"):
+            doc_fields = {k.lower(): (k, v) for k, v in table_record["fields"].items()}
+
+        # 3. Merge into lower-cased name -> (display name, DB type, documented metadata or None)
+        merged = {lower_name: (col["name"], col["type"], None) for lower_name, col in db_fields.items()}
+        for lower_name, (doc_name, doc_data) in doc_fields.items():
+            db_entry = merged.get(lower_name)
+            # Prefer documented name casing, keep the DB type
+            merged[lower_name] = (doc_name, db_entry[1] if db_entry else None, doc_data)
+
+        if not merged:
+            return {"result": f"No fields found for table {table_name}."}
+
+        lines = []
+        for lower_name in sorted(merged):
+            display_name, db_type, doc_data = merged[lower_name]
+            documented = doc_data is not None
+            if not documented:
+                doc_data = {}
+
+            # Skip ignored fields
+            if doc_data.get("ignored"):
+                continue
+
+            # Get data type from DB (truth) or docs (fallback)
+            doc_type = doc_data.get("data_type")
+
+            final_type = db_type or doc_type or "unknown"
+
+            line = f"- {display_name} ({final_type})"
+
+            # Include both short and long descriptions for SQL context
+            short_desc = doc_data.get("short_description")
+            long_desc = doc_data.get("long_description")
+            
+            if long_desc and len(long_desc) > 200:
+                # Limit long description to reasonable length
+                long_desc = long_desc[:197] + "..."
 
-            # 2. Get documented fields
-            table_record = manager.get_table(table_name)
-            doc_fields = {}
-            if table_record and table_record.get("fields"):
-                doc_fields = {k.lower(): (k, v) for k, v in table_record["fields"].items()}
+            if short_desc and long_desc:
+                line += f": {short_desc} | {long_desc}"
+            elif short_desc or long_desc:
+                line += f": {short_desc or long_desc}"
+            elif not documented:
+                line += " [Undocumented]"
 
-            # 3. Merge and format
-            all_field_names = sorted(list(set(db_fields.keys()) | set(doc_fields.keys())))
+            lines.append(line)
 
-            if not all_field_names:
-                return {"result": f"No fields found for table {table_name}."}
+        return {"result": f"Fields in {table_name}:\n" + "\n".join(lines)}
 
-            lines = []
-            for lower_name in all_field_names:
-                # Prefer documented name casing, fallback to DB name
-                display_name = doc_fields.get(lower_name, (db_fields.get(lower_name, {}).get("name"), {}))[0]
-                doc_data = doc_fields.get(lower_name, (None, {}))[1]
+    def _do_get_table_info(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Get detailed table information with relationships."""
+        if not table_name:
+            raise ValueError("table_name is required for get_table_info action.")
 
-                # Skip ignored fields
-                if doc_data.get("ignored"):
+        table_record = manager.get_table(table_name)
+        if not table_record:
+            # Try to get basic info from DuckDB
+            try:
+                columns = self.query_tool.fetch_table_schema(table_name)
+                if columns:
+                    lines = ["Table: " + table_name, "\nFields:"]
+                    for col in columns:
+                        col_name = col.get('name')
+                        col_type = col.get('type', col.get('column_type', 'unknown'))
+                        if col_name:
+                            lines.append(f"  - {col_name}: {col_type}")
+                    return {"result": "\n".join(lines)}
+            except Exception:
+                pass
+            return {"result": f"Table {table_name} not found."}
+
+        result_lines = [f"Table: {table_name}"]
+        if table_record.get("short_description"):
+            result_lines.append(f"Description: {table_record['short_description']}")
+        if table_record.get("long_description"):
+            result_lines.append(f"Details: {table_record['long_description']}")
+
+        fields = table_record.get("fields", {})
+        if fields:
+            result_lines.append("\nFields:")
+            for field_name, field_data in fields.items():
+                if field_data.get("ignored"):
                     continue
+                data_type = field_data.get("data_type", "")
+                short_desc = field_data.get("short_description", "")
+                long_desc = field_data.get("long_description", "")
+                nullability = field_data.get("nullability", "")
+                field_line = f"  - {field_name}"
+                if data_type:
+                    field_line += f" ({data_type})"
+                if nullability:
+                    field_line += f" [{nullability}]"
+
+                if short_desc and long_desc:
+                    field_line += f": {short_desc} | {long_desc}"
+                elif short_desc or long_desc:
+                    field_line += f": {short_desc or long_desc}"
+                result_lines.append(field_line)
+
+        relationships = table_record.get("relationships", [])
+        if relationships:
+            result_lines.append("\nRelationships:")
+            for rel in relationships:
+                field = rel.get("field")
+                related_table = rel.get("related_table")
+                related_field = rel.get("related_field")
+                rel_type = rel.get("type", "reference")
+                result_lines.append(
+                    f"  - {field} -> {related_table}.{related_field} ({rel_type})"
+                )
 
-                # Get data type from DB (truth) or docs (fallback)
-                db_type = db_fields.get(lower_name, {}).get("type")
-                doc_type = doc_data.get("data_type")
-
-                final_type = db_type or doc_type or "unknown"
-
-                line = f"- {display_name} ({final_type})"
-
-                # Include both short and long descriptions for SQL context
-                short_desc = doc_data.get("short_description")
-                long_desc = doc_data.get("long_description")
-                
-                descriptions = []
-                if short_desc:
-                    descriptions.append(short_desc)
-                if long_desc:
-                    # Limit long description to reasonable length
-                    if len(long_desc) > 200:
-                        long_desc = long_desc[:197] + "..."
-                    descriptions.append(long_desc)
-                
-                if descriptions:
-                    line += ": " + " | ".join(descriptions)
-                elif lower_name not in doc_fields:
-                    line += " [Undocumented]"
-
-                lines.append(line)
-
-            return {"result": f"Fields in {table_name}:\n" + "\n".join(lines)}
-
-        # Get detailed table information with relationships
-        if normalized_action == "get_table_info":
-            if not table_name:
-                raise ValueError("table_name is required for get_table_info action.")
-
-            table_record = manager.get_table(table_name)
-            if not table_record:
-                # Try to get basic info from DuckDB
-                try:
-                    columns = self.query_tool.fetch_table_schema(table_name)
-                    if columns:
-                        lines = ["Table: " + table_name, "\nFields:"]
-                        for col in columns:
-                            col_name = col.get('name')
-                            col_type = col.get('type', col.get('column_type', 'unknown'))
-                            if col_name:
-                                lines.append(f"  - {col_name}: {col_type}")
-                        return {"result": "\n".join(lines)}
-                except Exception:
-                    pass
-                return {"result": f"Table {table_name} not found."}
-
-            result_lines = [f"Table: {table_name}"]
-            if table_record.get("short_description"):
-                result_lines.append(f"Description: {table_record['short_description']}")
-            if table_record.get("long_description"):
-                result_lines.append(f"Details: {table_record['long_description']}")
+        return {"result": "\n".join(result_lines)}
 
+    def _do_list_saved_queries(
+        self,
+        manager: SchemaManager,
+        **_: Any,
+    ) -> dict[str, str]:
+        """List saved queries."""
+        queries = manager.list_queries()
+        if not queries:
+            return {"result": "No saved queries found."}
+
+        lines = ["Saved queries:"]
+        for query in queries:
+            name = query.get("name", "Untitled")
+            description = query.get("description", "")
+            sql = query.get("sql", "")
+            if description:
+                lines.append(f"\n- {name}: {description}")
+            else:
+                lines.append(f"\n- {name}")
+            if sql:
+                # Show first 100 chars of SQL
+                sql_preview = sql[:100] + "..." if len(sql) > 100 else sql
+                lines.append(f"  SQL: {sql_preview}")
+        return {"result": "\n".join(lines)}
+
+    def _do_get_full_schema(
+        self,
+        manager: SchemaManager,
+        **_: Any,
+    ) -> dict[str, str]:
+        """Get full schema summary."""
+        tables = manager.list_tables()
+        if not tables:
+            return {"result": "No schema information available."}
+
+        lines = ["Database Schema Summary:\n"]
+        for table in tables:
+            table_record = manager.get_table(table) or {}
+            short_desc = table_record.get("short_description", "")
             fields = table_record.get("fields", {})
-            if fields:
-                result_lines.append("\nFields:")
-                for field_name, field_data in fields.items():
-                    if field_data.get("ignored"):
-                        continue
-                    data_type = field_data.get("data_type", "")
-                    short_desc = field_data.get("short_description", "")
-                    long_desc = field_data.get("long_description", "")
-                    nullability = field_data.get("nullability", "")
-                    field_line = f"  - {field_name}"
-                    if data_type:
-                        field_line += f" ({data_type})"
-                    if nullability:
-                        field_line += f" [{nullability}]"
-
-                    descriptions = []
-                    if short_desc:
-                        descriptions.append(short_desc)
-                    if long_desc:
-                        descriptions.append(long_desc)
-
-                    if descriptions:
-                        field_line += ": " + " | ".join(descriptions)
-                    result_lines.append(field_line)
-
-            relationships = table_record.get("relationships", [])
-            if relationships:
-                result_lines.append("\nRelationships:")
-                for rel in relationships:
-                    field = rel.get("field")
-                    related_table = rel.get("related_table")
-                    related_field = rel.get("related_field")
-                    rel_type = rel.get("type", "reference")
-                    result_lines.append(
-                        f"  - {field} -> {related_table}.{related_field} ({rel_type})"
-                    )
-
-            return {"result": "\n".join(result_lines)}
-
-        # List saved queries
-        if normalized_action == "list_saved_queries":
-            queries = manager.list_queries()
-            if not queries:
-                return {"result": "No saved queries found."}
-
-            lines = ["Saved queries:"]
-            for query in queries:
-                name = query.get("name", "Untitled")
-                description = query.get("description", "")
-                sql = query.get("sql", "")
-                if description:
-                    lines.append(f"\n- {name}: {description}")
-                else:
-                    lines.append(f"\n- {name}")
-                if sql:
-                    # Show first 100 chars of SQL
-                    sql_preview = sql[:100] + "..." if len(sql) > 100 else sql
-                    lines.append(f"  SQL: {sql_preview}")
-            return {"result": "\n".join(lines)}
-
-        # Get full schema summary
-        if normalized_action == "get_full_schema":
-            tables = manager.list_tables()
-            if not tables:
-                return {"result": "No schema information available."}
 
-            lines = ["Database Schema Summary:\n"]
-            for table in tables:
-                table_record = manager.get_table(table) or {}
-                short_desc = table_record.get("short_description", "")
-                fields = table_record.get("fields", {})
-
-                lines.append(f"\nTable: {table}")
-                if short_desc:
-                    lines.append(f"  Description: {short_desc}")
-                lines.append(f"  Fields ({len(fields)}):")
-                for field_name, field_data in fields.items():
-                    if field_data.get("ignored"):
-                        continue
-                    data_type = field_data.get("data_type", "")
-                    lines.append(f"    - {field_name} ({data_type})")
-
-            return {"result": "\n".join(lines)}
-
-        # Update field metadata
-        if normalized_action == "update_field":
-            if not table_name or not field_name:
-                raise ValueError("table_name and field_name are required for update_field.")
-
-            try:
-                manager.update_field(
-                    table_name,
-                    field_name,
-                    short_description=short_description,
-                    long_description=long_description,
-                    data_type=data_type,
-                    nullability=nullability,
-                    ignored=ignored
-                )
-                return {"result": f"Updated metadata for {table_name}.{field_name}."}
-            except Exception as e:
-                return {"result": f"Failed to update field: {str(e)}"}
+            lines.append(f"\nTable: {table}")
+            if short_desc:
+                lines.append(f"  Description: {short_desc}")
+            lines.append(f"  Fields ({len(fields)}):")
+            lines.extend(
+                f"    - {field_name} ({field_data.get('data_type', '')})"
+                for field_name, field_data in fields.items()
+                if not field_data.get("ignored")
+            )
 
-        # Update table metadata
-        if normalized_action == "update_table":
-            if not table_name:
-                raise ValueError("table_name is required for update_table.")
+        return {"result": "\n".join(lines)}
 
-            try:
-                manager.update_table(
-                    table_name,
-                    short_description=short_description,
-                    long_description=long_description
-                )
-                return {"result": f"Updated metadata for table {table_name}."}
-            except Exception as e:
-                return {"result": f"Failed to update table: {str(e)}"}
-
-        # Backward compatibility for update_field_description
-        if normalized_action == "update_field_description":
-            if not table_name or not field_name:
-                raise ValueError("table_name and field_name are required.")
-            # Use the mapped long_description (from description arg if present)
-            try:
-                manager.update_field(table_name, field_name, long_description=long_description)
-                return {"result": f"Updated description for {table_name}.{field_name}."}
-            except Exception as e:
-                return {"result": f"Failed to update field: {str(e)}"}
-
-        # Search fields across all tables
-        if normalized_action == "search_fields":
-            if not query:
-                raise ValueError("query is required for search_fields action.")
-            
-            search_term = query.lower()
-            matches = []
-            
-            # Get all tables
-            try:
-                tables = self.query_tool.list_tables_in_database()
-            except Exception:
-                tables = manager.list_tables()
+    def _do_update_field(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        field_name: Optional[str],
+        short_description: Optional[str],
+        long_description: Optional[str],
+        data_type: Optional[str],
+        nullability: Optional[str],
+        ignored: Optional[bool],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Update field metadata."""
+        if not table_name or not field_name:
+            raise ValueError("table_name and field_name are required for update_field.")
+
+        try:
+            manager.update_field(
+                table_name,
+                field_name,
+                short_description=short_description,
+                long_description=long_description,
+                data_type=data_type,
+                nullability=nullability,
+                ignored=ignored
+            )
+            return {"result": f"Updated metadata for {table_name}.{field_name}."}
+        except Exception as e:
+            return {"result": f"Failed to update field: {str(e)}"}
+
+    def _do_update_table(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        short_description: Optional[str],
+        long_description: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Update table metadata."""
+        if not table_name:
+            raise ValueError("table_name is required for update_table.")
+
+        try:
+            manager.update_table(
+                table_name,
+                short_description=short_description,
+                long_description=long_description
+            )
+            return {"result": f"Updated metadata for table {table_name}."}
+        except Exception as e:
+            return {"result": f"Failed to update table: {str(e)}"}
+
+    def _do_update_field_description(
+        self,
+        manager: SchemaManager,
+        *,
+        table_name: Optional[str],
+        field_name: Optional[str],
+        long_description: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Backward compatibility for update_field_description."""
+        if not table_name or not field_name:
+            raise ValueError("table_name and field_name are required.")
+        # Use the mapped long_description (from description arg if present)
+        try:
+            manager.update_field(table_name, field_name, long_description=long_description)
+            return {"result": f"Updated description for {table_name}.{field_name}."}
+        except Exception as e:
+            return {"result": f"Failed to update field: {str(e)}"}
+
+    def _do_search_fields(
+        self,
+        manager: SchemaManager,
+        *,
+        query: Optional[str],
+        **_: Any,
+    ) -> dict[str, str]:
+        """Search fields across all tables."""
+        if not query:
+            raise ValueError("query is required for search_fields action.")
+        
+        search_term = query.lower()
+        matches: set[str] = set()
+        
+        # Get all tables
+        try:
+            tables = self.query_tool.list_tables_in_database()
+        except Exception:
+            tables = manager.list_tables()
+        
+        if not tables:
+            return {"result": "No tables found to search."}
+
+        # One catalog query for every table instead of one per table
+        try:
+            table_columns = self.query_tool.fetch_tables_schema(tables)
+        except Exception:
+            table_columns = {}
+
+        report_progress = self._progress_reporter()
+        for table in tables:
+            report_progress(f"Searching in table {table}...")
+
+            # Check table name match
+            if search_term in table.lower():
+                matches.add(f"Table: {table} (Name match)")
             
-            if not tables:
-                return {"result": "No tables found to search."}
-                
-            for table in tables:
-                # Report progress
-                if hasattr(self, "_agent_ref") and hasattr(self._agent_ref, "_on_step") and self._agent_ref._on_step:
-                    self._agent_ref._on_step(f"Searching in table {table}...")
-
-                # Check table name match
-                if search_term in table.lower():
-                    matches.append(f"Table: {table} (Name match)")
+            # Check fields
+            for col in table_columns.get(table, []):
+                col_name = col.get('name', '')
+                if search_term in str(col_name).lower():
+                    col_type = col.get('type', col.get('column_type', 'unknown'))
+                    matches.add(f"Field: {table}.{col_name} ({col_type})")
                 
-                # Check fields
+            # Check documentation
+            table_record = manager.get_table(table)
+            if table_record:
+                # Check table description
+                short_desc = table_record.get("short_description")
+                long_desc = table_record.get("long_description")
+                if (short_desc and search_term in short_desc.lower()) or (
+                    long_desc and search_term in long_desc.lower()
+                ):
+                    matches.add(f"Table: {table} (Description match)")
+                     
+                # Check field descriptions
+                fields = table_record.get("fields", {})
+                for f_name, f_data in fields.items():
+                    if f_data.get("ignored"):
+                        continue
+                    short_desc = f_data.get("short_description")
+                    long_desc = f_data.get("long_description")
+                    if (short_desc and search_term in short_desc.lower()) or (
+                        long_desc and search_term in long_desc.lower()
+                    ):
+                        matches.add(f"Field: {table}.{f_name} (Description match)")
+
+        if not matches:
+            return {"result": f"No matches found for '{query}'."}
+        
+        return {"result": f"Search results for '{query}':\n" + "\n".join(sorted(matches))}
+
+    def _sample_distinct_values(self, table_name: str, columns: List[str]) -> dict[str, List[str]]:
+        """Return up to ten distinct non-null values per column, probing all columns in one query."""
+        columns = list(dict.fromkeys(columns))
+        if not columns:
+            return {}
+
+        table = _quote_identifier(table_name)
+
+        def probe(index: int, column: str) -> str:
+            quoted = _quote_identifier(column)
+            return (
+                f'SELECT {index} AS probe, {quoted}::VARCHAR AS value FROM '
+                f'(SELECT DISTINCT {quoted} FROM {table} WHERE {quoted} IS NOT NULL LIMIT 10)'
+            )
+
+        try:
+            sql = " UNION ALL ".join(probe(index, column) for index, column in enumerate(columns))
+            rows = self.query_tool.execute_structured(sql).rows
+        except Exception:
+            # A single bad column fails the combined probe; sample the columns one by one instead
+            rows = []
+            for index, column in enumerate(columns):
                 try:
-                    columns = self.query_tool.fetch_table_schema(table)
-                    for col in columns:
-                        col_name = col.get('name', '')
-                        if search_term in str(col_name).lower():
-                            col_type = col.get('type', col.get('column_type', 'unknown'))
-                            matches.append(f"Field: {table}.{col_name} ({col_type})")
-                except Exception:
-                    pass
-                    
-                # Check documentation
-                table_record = manager.get_table(table)
-                if table_record:
-                    # Check table description
-                    t_desc = (table_record.get("short_description") or "") + " " + (table_record.get("long_description") or "")
-                    if search_term in t_desc.lower():
-                         matches.append(f"Table: {table} (Description match)")
-                         
-                    # Check field descriptions
-                    fields = table_record.get("fields", {})
-                    for f_name, f_data in fields.items():
-                        if f_data.get("ignored"):
-                            continue
-                        f_desc = (f_data.get("short_description") or "") + " " + (f_data.get("long_description") or "")
-                        if search_term in f_desc.lower():
-                             matches.append(f"Field: {table}.{f_name} (Description match)")
-
-            if not matches:
-                return {"result": f"No matches found for '{query}'."}
-            
-            # Deduplicate and sort
-            unique_matches = sorted(list(set(matches)))
-            return {"result": f"Search results for '{query}':\n" + "\n".join(unique_matches)}
-
-        raise ValueError(
-            f"Unknown action '{action}'. Supported: list_tables, list_fields, "
-            "get_table_info, list_saved_queries, get_full_schema, update_field, update_table, update_fields_batch."
-        )
+                    rows.extend(self.query_tool.execute_structured(probe(index, column)).rows)
+                except Exception as e:
+                    # If sampling fails, use provided type or default
+                    print(f"Warning: Could not sample data for {table_name}.{column}: {e}")
+
+        samples: dict[str, List[str]] = {column: [] for column in columns}
+        for index, value in rows:
+            samples[columns[index]].append(value)
+        return samples
+
+    def _progress_reporter(self) -> Callable[[str], None]:
+        """Return a callback forwarding progress messages to the agent, at most one per ``_PROGRESS_INTERVAL``."""
+        on_step = getattr(getattr(self, "_agent_ref", None), "_on_step", None)
+        if not on_step:
+            return lambda message: None
+        last_sent = -_PROGRESS_INTERVAL
+
+        def report(message: str) -> None:
+            nonlocal last_sent
+            now = time.monotonic()
+            if now - last_sent >= _PROGRESS_INTERVAL:
+                last_sent = now
+                on_step(message)
+
+        return report
 
     def _ensure_project_context(self) -> None:
         if not self.query_tool.current_database:
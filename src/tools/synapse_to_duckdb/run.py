@@ -6,10 +6,13 @@ import os
 import sys
 from contextlib import closing
 from pathlib import Path
-from typing import Dict, List, Mapping
+from typing import TYPE_CHECKING, Dict, List, Mapping
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:  # pragma: no cover - hints only
+    import pyodbc
+
 if __package__:
     from .synapse_to_duckdb import (
         SynapseConnectionConfig,
@@ -21,7 +24,7 @@ else:  # pragma: no cover - script entry compatibility
         copy_synapse_objects_to_duckdb,
     )
 
-BOOL_TRUE = {"1", "true", "yes", "on"}
+BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
 
 
 def require_env(name: str) -> str:
@@ -124,20 +127,26 @@ def gather_objects() -> List[Mapping[str, object]]:
     return objects
 
 
-def test_synapse_connection(config: SynapseConnectionConfig) -> None:
+def connect_to_synapse(config: SynapseConnectionConfig) -> "pyodbc.Connection":
+    """Open a Synapse connection and verify it with ``SELECT 1``; the caller owns (and closes) it."""
     try:
         import pyodbc
     except ImportError as exc:  # pragma: no cover - dependency guard
         raise RuntimeError("pyodbc is required to verify the Synapse connection.") from exc
 
-    with closing(pyodbc.connect(config.build_connection_string())) as conn:
+    conn = pyodbc.connect(config.build_connection_string())
+    try:
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT 1")
             cursor.fetchone()
         finally:
             cursor.close()
+    except Exception:
+        conn.close()
+        raise
     print("Confirmed connection to Azure Synapse.")
+    return conn
 
 
 def _parse_cli_args(argv: List[str]) -> argparse.Namespace:
@@ -166,6 +175,10 @@ def _resolve_duckdb_path(raw: str) -> str:
     directory = target_path.parent if target_path.parent != Path("") else Path.cwd()
     expected_name = target_path.name
 
+    # Exact match: no need to scan the directory for a differently-cased file
+    if target_path.is_file():
+        return str(target_path.resolve())
+
     try:
         for existing in directory.iterdir():
             if existing.is_file() and existing.suffix.lower() == ".duckdb":
@@ -198,24 +211,25 @@ def main(argv: List[str] | None = None) -> int:
     )
 
     print(f"Attempting to connect to Azure Synapse at {config.server}...")
-    test_synapse_connection(config)
-
-    requested_duckdb = args.duckdb_path or os.environ.get("DUCKDB_PATH", "local.duckdb")
-    duckdb_path = _resolve_duckdb_path(requested_duckdb)
-    objects = gather_objects()
-
-    if overwrite_existing:
-        print("Existing DuckDB tables will be replaced if encountered.")
-    else:
-        print("Existing DuckDB tables will be kept; matching tables are skipped.")
-
-    print(f"Copying {len(objects)} object(s) into DuckDB at {duckdb_path}...")
-    copy_synapse_objects_to_duckdb(
-        config,
-        duckdb_path,
-        objects,
-        overwrite_existing=overwrite_existing,
-    )
+    # The verified connection is reused for the copy instead of opening a second one
+    with closing(connect_to_synapse(config)) as synapse_conn:
+        requested_duckdb = args.duckdb_path or os.environ.get("DUCKDB_PATH", "local.duckdb")
+        duckdb_path = _resolve_duckdb_path(requested_duckdb)
+        objects = gather_objects()
+
+        if overwrite_existing:
+            print("Existing DuckDB tables will be replaced if encountered.")
+        else:
+            print("Existing DuckDB tables will be kept; matching tables are skipped.")
+
+        print(f"Copying {len(objects)} object(s) into DuckDB at {duckdb_path}...")
+        copy_synapse_objects_to_duckdb(
+            config,
+            duckdb_path,
+            objects,
+            overwrite_existing=overwrite_existing,
+            synapse_conn=synapse_conn,
+        )
     print(f"Completed processing {len(objects)} object(s) for DuckDB at {duckdb_path}.")
     return 0
 
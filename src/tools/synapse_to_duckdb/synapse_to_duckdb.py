@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence as SequenceABC
-from contextlib import closing
+from contextlib import closing, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
@@ -109,6 +109,7 @@ def copy_synapse_objects_to_duckdb(
     objects: Sequence[Mapping[str, object]],
     *,
     overwrite_existing: bool = True,
+    synapse_conn: Optional["pyodbc.Connection"] = None,  # type: ignore
 ) -> None:
     """
     Copy data from Azure Synapse SQL views or ad-hoc queries into local DuckDB tables.
@@ -139,6 +140,9 @@ def copy_synapse_objects_to_duckdb(
     overwrite_existing:
         When ``True`` (default), existing DuckDB tables with the same destination name are replaced. When ``False``,
         already-present tables are left untouched and logged as skipped.
+    synapse_conn:
+        Optional open pyodbc connection to reuse (e.g. one the caller already verified). It is left open; when
+        omitted, a connection is opened from ``connection_config`` and closed once the copy finishes.
 
     Raises
     ------
@@ -180,21 +184,30 @@ def copy_synapse_objects_to_duckdb(
         ) from pandas_import_error
 
     duck_path = Path(duckdb_path).expanduser()
-    connection_string = connection_config.build_connection_string()
+    if synapse_conn is None:
+        synapse_context: Any = closing(pyodbc.connect(connection_config.build_connection_string()))
+    else:
+        synapse_context = nullcontext(synapse_conn)
 
-    with closing(pyodbc.connect(connection_string)) as synapse_conn, closing(
+    # One cursor serves every object; executing a new statement discards any unread rows of the previous one
+    with synapse_context as synapse_conn, closing(synapse_conn.cursor()) as synapse_cursor, closing(
         duckdb.connect(str(duck_path))
     ) as duck_conn:
+        # NOCOUNT is a session setting, so set it once: "rows affected" messages would interfere with result sets
+        synapse_cursor.execute("SET NOCOUNT ON")
+        # One catalog query up front; _copy_single_object records the tables it creates
+        existing_tables = _existing_tables(duck_conn)
         for index, obj in enumerate(objects, start=1):
-            _copy_single_object(index, obj, synapse_conn, duck_conn, overwrite_existing)
+            _copy_single_object(index, obj, synapse_cursor, duck_conn, overwrite_existing, existing_tables)
 
 
 def _copy_single_object(
     index: int,
     obj: Mapping[str, object],
-    synapse_conn: "pyodbc.Connection",  # type: ignore
+    synapse_cursor: "pyodbc.Cursor",  # type: ignore
     duck_conn: DuckDBPyConnection,
     overwrite_existing: bool,
+    existing_tables: set[tuple[str, str]],
 ) -> None:
     view_name = cast(Optional[str], obj.get("view"))
     query_text = cast(Optional[str], obj.get("query"))
@@ -239,7 +252,7 @@ def _copy_single_object(
         destination = default_destination
     else:
         destination = str(raw_destination).strip() or default_destination
-    exists_already = _table_exists(destination, duck_conn)
+    exists_already = _table_exists(destination, existing_tables)
 
     if exists_already and not overwrite_existing:
         print(f"- Skipping '{destination}' (already exists in DuckDB).")
@@ -256,7 +269,7 @@ def _copy_single_object(
     first_batch = True
     total_rows = 0
     
-    for df in _fetch_batches(index, str(query_text), params, synapse_conn):
+    for df in _fetch_batches(index, str(query_text), params, synapse_cursor):
         df = _coerce_dataframe_types(df)
         duck_conn.register(temp_name, df)
         
@@ -274,6 +287,8 @@ def _copy_single_object(
         finally:
             duck_conn.unregister(temp_name)
 
+    schema, table = _split_destination(destination)
+    existing_tables.add(((schema or "main").lower(), table.lower()))
     print(f"  Finished '{destination}'. Total rows: {total_rows}")
 
 
@@ -294,67 +309,70 @@ def _fetch_batches(
     index: int,
     query: str,
     params: Optional[tuple[Any, ...]],
-    synapse_conn: "pyodbc.Connection",  # type: ignore
+    cursor: "pyodbc.Cursor",  # type: ignore
     batch_size: int = 10000,
 ) -> Iterator["pd.DataFrame"]:  # type: ignore
     if pd is None:
         raise RuntimeError("pandas is unavailable while fetching data from Synapse.")
 
-    cursor = synapse_conn.cursor()
     try:
-        # Prevent "rows affected" messages from interfering with result sets
-        cursor.execute("SET NOCOUNT ON")
-        try:
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-        except Exception as e:
-            # Retry with ANSI_WARNINGS OFF if truncation error occurs
-            if "String or binary data would be truncated" in str(e):
-                try:
-                    cursor.execute("SET ANSI_WARNINGS OFF")
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
-                except Exception as retry_e:
-                    _raise_execution_error(index, query, params, retry_e)
-            else:
-                _raise_execution_error(index, query, params, e)
-
-        # Skip past any non-result-set messages (e.g. from triggers or SET commands)
-        while cursor.description is None:
-            if not cursor.nextset():
-                break
-
-        if cursor.description is None:
-            info_lines = [f"Query for item #{index} did not return a result set (cursor.description is None)."]
-            info_lines.append("This typically means:")
-            info_lines.append("- The view/table exists but has no column definitions")
-            info_lines.append("- The view is a stored procedure or non-SELECT object")
-            info_lines.append("- The query executed but returned no metadata")
-            info_lines.append("\nExecuted SQL:")
-            info_lines.append(query.strip())
-            if params:
-                info_lines.append(f"Parameters: {list(params)}")
-            info_lines.append(f"\nRow count returned: {cursor.rowcount}")
-            raise ValueError(
-                "\n".join(info_lines)
-            )
-
-        columns = [column[0] for column in cursor.description]
-        
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+    except Exception as e:
+        # Retry with ANSI_WARNINGS OFF if truncation error occurs
+        if "String or binary data would be truncated" in str(e):
+            try:
+                cursor.execute("SET ANSI_WARNINGS OFF")
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+            except Exception as retry_e:
+                _raise_execution_error(index, query, params, retry_e)
+        else:
+            _raise_execution_error(index, query, params, e)
+
+    # Skip past any non-result-set messages (e.g. from triggers or SET commands)
+    while cursor.description is None:
+        if not cursor.nextset():
+            break
+
+    if cursor.description is None:
+        info_lines = [f"Query for item #{index} did not return a result set (cursor.description is None)."]
+        info_lines.append("This typically means:")
+        info_lines.append("- The view/table exists but has no column definitions")
+        info_lines.append("- The view is a stored procedure or non-SELECT object")
+        info_lines.append("- The query executed but returned no metadata")
+        info_lines.append("\nExecuted SQL:")
+        info_lines.append(query.strip())
+        if params:
+            info_lines.append(f"Parameters: {list(params)}")
+        info_lines.append(f"\nRow count returned: {cursor.rowcount}")
+        raise ValueError(
+            "\n".join(info_lines)
+        )
+
+    columns = [column[0] for column in cursor.description]
+    
+    rows = cursor.fetchmany(batch_size)
+    if not rows:
+        yield pd.DataFrame.from_records([], columns=columns)
+        return
+
+    while rows:
+        yield _rows_to_dataframe(rows, columns)
         rows = cursor.fetchmany(batch_size)
-        if not rows:
-            yield pd.DataFrame.from_records([], columns=columns)
-            return
 
-        while rows:
-            yield pd.DataFrame.from_records(rows, columns=columns)
-            rows = cursor.fetchmany(batch_size)
-    finally:
-        cursor.close()
+
+def _rows_to_dataframe(rows: Sequence[Any], columns: list[str]) -> "pd.DataFrame":  # type: ignore[valid-type]
+    """Build a DataFrame column by column; ``from_records`` would first copy every pyodbc row into a tuple."""
+    assert pd is not None  # Narrow for static analysis.
+    # Key by position so duplicate column names (e.g. from joins) survive, then apply the real names
+    df = pd.DataFrame(dict(enumerate(zip(*rows))))
+    df.columns = columns
+    return df
 
 
 def _raise_execution_error(
@@ -385,19 +403,19 @@ def _quote_identifier(identifier: str) -> str:
     return ".".join(quoted_parts)
 
 
-def _table_exists(destination: str, duck_conn: DuckDBPyConnection) -> bool:
+def _existing_tables(duck_conn: DuckDBPyConnection) -> set[tuple[str, str]]:
+    rows = duck_conn.execute(
+        "SELECT lower(table_schema), lower(table_name) FROM information_schema.tables"
+    ).fetchall()
+    return {(schema, table) for schema, table in rows}
+
+
+def _table_exists(destination: str, existing_tables: set[tuple[str, str]]) -> bool:
     schema, table = _split_destination(destination)
+    table = table.lower()
     if schema:
-        result = duck_conn.execute(
-            "SELECT 1 FROM information_schema.tables WHERE lower(table_schema) = ? AND lower(table_name) = ? LIMIT 1",
-            [schema.lower(), table.lower()],
-        ).fetchone()
-    else:
-        result = duck_conn.execute(
-            "SELECT 1 FROM information_schema.tables WHERE lower(table_name) = ? LIMIT 1",
-            [table.lower()],
-        ).fetchone()
-    return result is not None
+        return (schema.lower(), table) in existing_tables
+    return any(name == table for _, name in existing_tables)
 
 
 def _split_destination(destination: str) -> tuple[Optional[str], str]:
@@ -422,20 +440,19 @@ def _strip_identifier(value: str) -> str:
 
 
 def _coerce_dataframe_types(df: "pd.DataFrame") -> "pd.DataFrame":  # type: ignore[valid-type]
-    """Attempt to coerce object-typed columns to numerics when every value is parseable."""
+    """Coerce object-typed columns to numerics, in place, when every non-null value is parseable."""
     if pd is None:
         raise RuntimeError("pandas is required to coerce dataframe types.")
 
     assert pd is not None  # Narrow for static analysis.
-    result = df.copy()
-    for column in result.columns:
-        series = result[column]
-        if pd.api.types.is_object_dtype(series):
-            converted = pd.to_numeric(series, errors="coerce")
-            if converted.isna().any():
-                original_na = series.isna()
-                if converted.isna().equals(original_na):
-                    result[column] = converted
-            else:
-                result[column] = converted
-    return result
+    # Batches are built fresh by _fetch_batches and owned by the caller, so no defensive copy is needed
+    for column in df.columns:
+        series = df[column]
+        if not pd.api.types.is_object_dtype(series):
+            continue
+        converted = pd.to_numeric(series, errors="coerce")
+        converted_na = converted.isna().to_numpy()
+        # Keep the column as-is if coercion turned any non-null value into NaN
+        if not converted_na.any() or (converted_na == series.isna().to_numpy()).all():
+            df[column] = converted
+    return df